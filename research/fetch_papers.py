@@ -1,7 +1,9 @@
 import urllib.request
 import re
 import os
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 urls = [
     "https://arxiv.org/abs/2504.02898",
@@ -19,6 +21,15 @@ urls = [
 output_dir = "research/audio_deepfake"
 summary_file = os.path.join(output_dir, "SUMMARY.md")
 
+# Number of papers fetched concurrently (kept small to be polite to arxiv)
+max_workers = 4
+
+# Title: <h1 class="title mathjax"><span class="descriptor">Title:</span> ... </h1>
+_TITLE_RE = re.compile(r'<h1 class="title mathjax"><span class="descriptor">Title:</span>(.*?)</h1>', re.DOTALL)
+# Abstract: <blockquote class="abstract mathjax"> <span class="descriptor">Abstract:</span> ... </blockquote>
+_ABSTRACT_RE = re.compile(r'<blockquote class="abstract mathjax">\s*<span class="descriptor">Abstract:</span>(.*?)</blockquote>', re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+
 if not os.path.exists(output_dir):
     os.makedirs(output_dir)
 
@@ -32,56 +43,73 @@ def fetch_url(url):
 
 def download_file(url, filepath):
     try:
-        urllib.request.urlretrieve(url, filepath)
+        # Stream socket -> disk in fixed-size blocks instead of buffering the whole PDF
+        with urllib.request.urlopen(url) as response, open(filepath, "wb") as f:
+            shutil.copyfileobj(response, f, length=1 << 16)
         return True
     except Exception as e:
         print(f"Error downloading {url}: {e}")
         return False
 
 def clean_text(text):
-    return re.sub(r'\s+', ' ', text).strip()
+    return _WS_RE.sub(' ', text).strip()
 
 def extract_info(html):
-    # Title: <h1 class="title mathjax"><span class="descriptor">Title:</span> ... </h1>
-    title_match = re.search(r'<h1 class="title mathjax"><span class="descriptor">Title:</span>(.*?)</h1>', html, re.DOTALL)
+    title_match = _TITLE_RE.search(html)
     title = clean_text(title_match.group(1)) if title_match else "Unknown Title"
 
-    # Abstract: <blockquote class="abstract mathjax"> <span class="descriptor">Abstract:</span> ... </blockquote>
-    abstract_match = re.search(r'<blockquote class="abstract mathjax">\s*<span class="descriptor">Abstract:</span>(.*?)</blockquote>', html, re.DOTALL)
+    abstract_match = _ABSTRACT_RE.search(html)
     abstract = clean_text(abstract_match.group(1)) if abstract_match else "Unknown Abstract"
 
     return title, abstract
 
-with open(summary_file, "w") as f:
-    f.write("# Research Summary: AI Voice Detection\n\n")
+def process_paper(url):
+    print(f"Processing {url}...")
+    html = fetch_url(url)
+    if not html:
+        return None
+
+    title, abstract = extract_info(html)
 
-    for url in urls:
-        print(f"Processing {url}...")
-        html = fetch_url(url)
-        if not html:
-            continue
+    # PDF URL
+    pdf_url = url.replace("/abs/", "/pdf/") + ".pdf"
+    pdf_filename = url.split("/")[-1] + ".pdf"
+    pdf_path = os.path.join(output_dir, pdf_filename)
 
-        title, abstract = extract_info(html)
+    print(f"  Title: {title}")
+    print(f"  Downloading PDF to {pdf_path}...")
 
-        # PDF URL
-        pdf_url = url.replace("/abs/", "/pdf/") + ".pdf"
-        pdf_filename = url.split("/")[-1] + ".pdf"
-        pdf_path = os.path.join(output_dir, pdf_filename)
+    if download_file(pdf_url, pdf_path):
+        print("  Download success.")
+    else:
+        print("  Download failed.")
 
-        print(f"  Title: {title}")
-        print(f"  Downloading PDF to {pdf_path}...")
+    # Be polite to the server
+    time.sleep(1)
 
-        if download_file(pdf_url, pdf_path):
-            print("  Download success.")
-        else:
-            print("  Download failed.")
+    return title, abstract, pdf_filename
 
-        f.write(f"## [{title}]({url})\n\n")
-        f.write(f"**Abstract**:\n{abstract}\n\n")
-        f.write(f"**PDF**: [Local Copy]({pdf_filename})\n\n")
-        f.write("---\n\n")
+with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # map() yields results in input order, so SUMMARY.md stays deterministic
+    results = list(executor.map(process_paper, urls))
 
-        # Be polite to the server
-        time.sleep(1)
+parts = ["# Research Summary: AI Voice Detection\n\n"]
+
+for url, paper in zip(urls, results):
+    if paper is None:
+        continue
+
+    title, abstract, pdf_filename = paper
+
+    parts.append(
+        f"## [{title}]({url})\n\n"
+        f"**Abstract**:\n{abstract}\n\n"
+        f"**PDF**: [Local Copy]({pdf_filename})\n\n"
+        "---\n\n"
+    )
+
+# Single write at the end so an interrupted run never leaves a partial SUMMARY.md
+with open(summary_file, "w") as f:
+    f.write("".join(parts))
 
 print(f"Done. Summary written to {summary_file}")
@@ -6,36 +6,44 @@ This script tests all available detection metrics across text, image, audio, and
 It handles missing dependencies gracefully and provides a summary report.
 """
 
+import os
 import sys
 import subprocess
-import glob
+import fnmatch
+import importlib
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 
 
+# Import names (e.g. "PIL", "cv2"), not distribution names
+DEPS_MAP = {
+    "core": ["numpy", "scipy", "pydantic"],
+    "text": ["transformers", "torch", "nltk"],
+    "image": ["torch", "torchvision", "diffusers", "PIL", "cv2"],
+    "audio": ["torch", "torchaudio", "transformers", "librosa", "soundfile"],
+    "video": ["torch", "torchvision", "cv2", "av", "librosa"],
+}
+
+# Imported once in the parent so forked test processes inherit them
+PRELOAD_MODULES = ["numpy", "torch", "transformers"]
+
+
+@lru_cache(maxsize=None)
+def probe_dependencies():
+    """Probe every unique dependency across all module types exactly once.
+
+    Uses ``find_spec`` so presence is checked without actually importing
+    heavy packages such as torch or transformers.
+    """
+    all_deps = set().union(*DEPS_MAP.values())
+    return {dep: find_spec(dep) is not None for dep in all_deps}
+
+
 def check_dependencies(module_type):
     """Check if dependencies for a module type are installed."""
-    deps_map = {
-        "core": ["numpy", "scipy", "pydantic"],
-        "text": ["transformers", "torch", "nltk"],
-        "image": ["torch", "torchvision", "diffusers", "PIL", "cv2"],
-        "audio": ["torch", "torchaudio", "transformers", "librosa", "soundfile"],
-        "video": ["torch", "torchvision", "cv2", "av", "librosa"],
-    }
-    
-    missing = []
-    for dep in deps_map.get(module_type, []):
-        try:
-            # Handle special cases for import names vs package names
-            if dep == "PIL":
-                __import__("PIL")
-            elif dep == "cv2":
-                __import__("cv2")
-            else:
-                __import__(dep)
-        except ImportError:
-            missing.append(dep)
-    
-    return missing
+    available = probe_dependencies()
+    return [dep for dep in DEPS_MAP.get(module_type, []) if not available[dep]]
 
 
 def install_dependencies(extras):
@@ -45,55 +53,107 @@ def install_dependencies(extras):
     print(f"{'='*60}\n")
     
     cmd = [sys.executable, "-m", "pip", "install", "-e", f".[{extras}]"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Stream pip's output as it arrives instead of buffering the whole log
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+    )
+    for line in process.stdout:
+        print(line, end="")
+    returncode = process.wait()
     
-    if result.returncode == 0:
+    if returncode == 0:
         print(f"✅ Successfully installed {extras} dependencies")
+        # Newly installed packages must be visible to later dependency checks
+        importlib.invalidate_caches()
+        probe_dependencies.cache_clear()
         return True
     else:
         print(f"❌ Failed to install {extras} dependencies")
-        print(result.stderr)
         return False
 
 
-def run_tests(test_path=None, verbose=True):
-    """Run pytest on specified path or all tests."""
+@lru_cache(maxsize=None)
+def collect_test_files(root="tests"):
+    """Walk the test tree once and return all test file paths."""
+    return frozenset(str(p) for p in Path(root).rglob("test_*.py"))
+
+
+def resolve_test_paths(patterns):
+    """Expand glob patterns against the cached test file set."""
+    paths = []
+    for pattern in patterns:
+        if "*" in pattern:
+            paths.extend(sorted(f for f in collect_test_files() if fnmatch.fnmatchcase(f, pattern)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+def preload_heavy_modules():
+    """Import the slow-to-import packages that are installed, before forking."""
+    available = probe_dependencies()
+    for name in PRELOAD_MODULES:
+        if available[name]:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass  # A broken install surfaces in the tests themselves
+
+
+def _pytest_process(args):
+    """Process entry point: run pytest once and exit with its status."""
+    import pytest
+
+    sys.exit(int(pytest.main(args)))
+
+
+def run_tests(test_path=None, verbose=True, coverage=False):
+    """Run pytest on specified path or all tests.
+
+    Each call runs pytest in its own process: repeated in-process
+    ``pytest.main`` calls are unsupported, and the conftest ``sys.modules``
+    stubs from one module's run would leak into the next. Where ``fork`` is
+    available the process is forked, so packages imported by
+    ``preload_heavy_modules`` (torch, transformers) are inherited instead of
+    re-imported; elsewhere a fresh ``python -m pytest`` is started.
+    """
+    import multiprocessing
+
     print(f"\n{'='*60}")
     print(f"Running tests: {test_path or 'all'}")
     print(f"{'='*60}\n")
     
-    cmd = [sys.executable, "-m", "pytest"]
+    args = []
     
     if test_path:
         # Handle list of paths or glob patterns
-        paths_to_run = []
-        if isinstance(test_path, list):
-            for p in test_path:
-                if "*" in p:
-                    paths_to_run.extend(glob.glob(p))
-                else:
-                    paths_to_run.append(p)
-        elif isinstance(test_path, str):
-             if "*" in test_path:
-                 paths_to_run.extend(glob.glob(test_path))
-             else:
-                 paths_to_run.append(test_path)
+        patterns = [test_path] if isinstance(test_path, str) else test_path
+        paths_to_run = resolve_test_paths(patterns)
         
         if not paths_to_run:
              print(f"⚠️  No tests found for path(s): {test_path}")
              return False
              
-        cmd.extend(paths_to_run)
+        args.extend(paths_to_run)
     
     if verbose:
-        cmd.append("-v")
+        args.append("-v")
+    
+    # Add summary
+    args.extend(["--tb=short", "-ra"])
     
-    # Add summary and coverage
-    cmd.extend(["--tb=short", "-ra", "--cov=veridex", "--cov-report=term-missing"])
+    # Line tracing roughly doubles runtime, so coverage is opt-in
+    if coverage:
+        args.extend(["--cov=veridex", "--cov-report=term-missing"])
     
-    # Run with stderr redirected to stdout so we capture everything
-    result = subprocess.run(cmd, capture_output=False, text=True)
-    return result.returncode == 0
+    sys.stdout.flush()
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return subprocess.run([sys.executable, "-m", "pytest", *args]).returncode == 0
+
+    process = multiprocessing.get_context("fork").Process(target=_pytest_process, args=(args,))
+    process.start()
+    process.join()
+    return process.exitcode == 0
 
 
 def main():
@@ -114,13 +174,17 @@ def main():
             print("❌ Failed to install pytest. Exiting.")
             sys.exit(1)
 
+    # Coverage is only collected when VERIDEX_COV=1 (e.g. in CI)
+    coverage = os.environ.get("VERIDEX_COV") == "1"
+
     # Check for pytest-cov
-    try:
-        import pytest_cov
-    except ImportError:
-        print("\n⚠️  pytest-cov not found. Installing...")
-        install_dependencies("dev") # Assuming dev includes it, or we manually install
-        subprocess.run([sys.executable, "-m", "pip", "install", "pytest-cov"], capture_output=True)
+    if coverage:
+        try:
+            import pytest_cov
+        except ImportError:
+            print("\n⚠️  pytest-cov not found. Installing...")
+            install_dependencies("dev") # Assuming dev includes it, or we manually install
+            subprocess.run([sys.executable, "-m", "pip", "install", "pytest-cov"], capture_output=True)
     
     # Test configuration
     test_modules = {
@@ -197,6 +261,8 @@ def main():
     print("\n" + "="*60)
     print("RUNNING TESTS")
     print("="*60)
+
+    preload_heavy_modules()
     
     results = {}
     
@@ -205,7 +271,12 @@ def main():
         test_path = config["path"]
         
         print(f"\n📋 Testing {config['description']}...")
-        success = run_tests(test_path, verbose=True)
+        # Modules with missing deps mostly skip, so tracing them is wasted work
+        success = run_tests(
+            test_path,
+            verbose=True,
+            coverage=coverage and not check_dependencies(config["deps"]),
+        )
         results[module_type] = "passed" if success else "failed"
     
     # Summary
@@ -0,0 +1,22 @@
+"""
+Shared random number generation for tests.
+
+Uses a seeded PCG64 generator (``np.random.default_rng``) instead of the legacy
+global ``np.random.randn`` so test data is reproducible and generated directly
+as float32.
+"""
+import numpy as np
+
+RNG = np.random.default_rng(0)
+
+
+def randn32(shape):
+    """Standard normal samples of the given shape as float32."""
+    return RNG.standard_normal(shape, dtype=np.float32)
+
+
+def random_image(shape):
+    """Read-only uint8 noise image of the given shape, for sharing across tests."""
+    image = RNG.integers(0, 256, shape, dtype=np.uint8)
+    image.setflags(write=False)
+    return image
@@ -0,0 +1,67 @@
+"""
+Shared read-only spectrogram fixtures for audio tests.
+"""
+import numpy as np
+import pytest
+
+
+def _frozen(array):
+    array.setflags(write=False)
+    return array
+
+
+# (n_mels, frames) mel-spectrogram patterns
+MEL_ZEROS = _frozen(np.zeros((80, 100), dtype=np.float32))
+MEL_HALF = _frozen(np.full((80, 100), 0.5, dtype=np.float32))
+
+# (freq_bins, frames) STFT output for n_fft=512
+ZXX_ONES = _frozen(np.ones((257, 100), dtype=complex))
+
+_rng = np.random.default_rng(0)
+ZXX_NOISE = _frozen(
+    (
+        _rng.standard_normal((257, 100), dtype=np.float32)
+        + 1j * _rng.standard_normal((257, 100), dtype=np.float32)
+    ).astype(np.complex64)
+)
+
+
+@pytest.fixture(scope="session")
+def mel_zeros():
+    """All-zero mel-spectrogram; copy before mutating."""
+    return MEL_ZEROS
+
+
+@pytest.fixture(scope="session")
+def mel_half():
+    """Uniform mel-spectrogram (AI-like)."""
+    return MEL_HALF
+
+
+@pytest.fixture(scope="session")
+def zxx_ones():
+    """Uniform complex STFT output."""
+    return ZXX_ONES
+
+
+@pytest.fixture(scope="session")
+def zxx_noise():
+    """Seeded complex64 noise standing in for a real STFT output."""
+    return ZXX_NOISE
+
+
+@pytest.fixture(scope="session")
+def spectral_tone_features(sine_440_16k_5s):
+    """SpectralSignal features of the cached 440 Hz tone, computed once per session."""
+    pytest.importorskip("librosa")
+    from veridex.audio.spectral import SpectralSignal
+    from veridex.audio.utils import compute_spectrogram
+
+    detector = SpectralSignal()
+    spectrogram = compute_spectrogram(
+        sine_440_16k_5s,
+        sr=detector.target_sr,
+        n_fft=detector.n_fft,
+        hop_length=detector.hop_length,
+    )
+    return detector._extract_spectral_features(spectrogram, detector.target_sr)
@@ -2,13 +2,21 @@
 Tests for breathing-based audio deepfake detector.
 """
 
+import sys
+import types
 import pytest
 import numpy as np
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from veridex.audio.breathing_signal import BreathingSignal
 from veridex.core.signal import DetectionResult
 
 
+@pytest.fixture(scope="module")
+def breathing():
+    """Shared BreathingSignal for tests that do not touch its configuration."""
+    return BreathingSignal()
+
+
 class TestBreathingSignal:
     """Test suite for BreathingSignal."""
 
@@ -32,41 +40,35 @@ class TestBreathingSignal:
         signal = BreathingSignal()
         assert signal.dtype == "audio"
 
-    def test_check_dependencies_missing_librosa(self):
+    def test_check_dependencies_missing_librosa(self, monkeypatch):
         """Test dependency check when librosa is missing."""
         signal = BreathingSignal()
         
-        with patch.dict('sys.modules', {'librosa': None}):
-            with patch('builtins.__import__', side_effect=ImportError):
-                with pytest.raises(ImportError) as exc_info:
-                    signal.check_dependencies()
-                
-                assert "librosa" in str(exc_info.value).lower()
+        # A None entry in sys.modules makes the next import raise ImportError
+        monkeypatch.setitem(sys.modules, 'librosa', None)
+        with pytest.raises(ImportError) as exc_info:
+            signal.check_dependencies()
+        
+        assert "librosa" in str(exc_info.value).lower()
 
-    def test_check_dependencies_success(self):
+    def test_check_dependencies_success(self, monkeypatch):
         """Test dependency check when all dependencies are present."""
         signal = BreathingSignal()
         
-        with patch('builtins.__import__') as mock_import:
-            mock_import.return_value = MagicMock()
-            # Should not raise
-            signal.check_dependencies()
+        monkeypatch.setitem(sys.modules, 'librosa', types.ModuleType('librosa'))
+        monkeypatch.setitem(sys.modules, 'scipy', types.ModuleType('scipy'))
+        # Should not raise
+        signal.check_dependencies()
 
-    def test_run_invalid_input_type(self):
+    @pytest.mark.parametrize("bad_input", [123, {"audio": "data"}, [1, 2, 3], 3.14])
+    def test_run_invalid_input_type(self, breathing, bad_input):
         """Test run with invalid input types."""
-        signal = BreathingSignal()
-        
-        # Test with integer
-        result = signal.run(123)
+        result = breathing.run(bad_input)
         assert isinstance(result, DetectionResult)
         assert result.score == 0.0
         assert result.confidence == 0.0
         assert "Input must be a file path" in result.error
 
-        # Test with list
-        result = signal.run([1, 2, 3])
-        assert result.error is not None
-
     def test_run_missing_dependencies(self):
         """Test run when dependencies are missing."""
         signal = BreathingSignal()
@@ -117,50 +119,33 @@ class TestBreathingSignal:
         assert metrics["breaths_per_minute"] == 0
         assert metrics["avg_breath_duration"] == 0
 
-    def test_compute_score_very_low_bpm(self):
-        """Test score computation with very low BPM (strong AI indicator)."""
+    @pytest.mark.parametrize("metrics,lo,hi", [
+        # Very low BPM (strong AI indicator) should give high AI score
+        pytest.param(
+            {"duration": 10.0, "breaths_per_minute": 0.5, "num_breaths": 1},
+            0.8, 1.0,
+            id="very_low_bpm",
+        ),
+        # Normal BPM (human indicator) should give low AI score
+        pytest.param(
+            {"duration": 10.0, "breaths_per_minute": 15.0, "num_breaths": 3},
+            0.0, 0.3,
+            id="normal_bpm",
+        ),
+        # Short audio (unreliable) should return neutral score
+        pytest.param(
+            {"duration": 2.0, "breaths_per_minute": 0.0, "num_breaths": 0},
+            0.5, 0.5,
+            id="short_audio",
+        ),
+    ])
+    def test_compute_score(self, metrics, lo, hi):
+        """Test score computation across breathing-rate regimes."""
         signal = BreathingSignal()
         
-        metrics = {
-            "duration": 10.0,
-            "breaths_per_minute": 0.5,
-            "num_breaths": 1
-        }
-        
-        score = signal._compute_score(metrics)
-        
-        # Very low BPM should give high AI score
-        assert score >= 0.8
-
-    def test_compute_score_normal_bpm(self):
-        """Test score computation with normal BPM (human indicator)."""
-        signal = BreathingSignal()
-        
-        metrics = {
-            "duration": 10.0,
-            "breaths_per_minute": 15.0,
-            "num_breaths": 3
-        }
-        
-        score = signal._compute_score(metrics)
-        
-        # Normal BPM should give low AI score
-        assert score <= 0.3
-
-    def test_compute_score_short_audio(self):
-        """Test score computation with short audio (unreliable)."""
-        signal = BreathingSignal()
-        
-        metrics = {
-            "duration": 2.0,
-            "breaths_per_minute": 0.0,
-            "num_breaths": 0
-        }
-        
         score = signal._compute_score(metrics)
         
-        # Short audio should return neutral score
-        assert score == 0.5
+        assert lo <= score <= hi
 
     def test_compute_confidence_short_audio(self):
         """Test confidence estimation with short audio."""
@@ -1,18 +1,16 @@
 import numpy as np
 import librosa
 from veridex.audio import SilenceSignal
+from tests._rng import randn32
 
 def test_silence():
     signal = SilenceSignal()
     
-    # Create dummy audio (1 second of silence, 1 second of noise)
+    # Create dummy audio: silence + noise + silence (1 second each),
+    # filled in place in a single preallocated buffer
     sr = 22050
-    t = np.linspace(0, 1, sr)
-    noise = np.random.normal(0, 1, sr) * 0.5
-    silence = np.zeros(sr)
-    
-    # Concatenate silence + noise + silence
-    audio = np.concatenate([silence, noise, silence])
+    audio = np.zeros(3 * sr, dtype=np.float32)
+    audio[sr:2 * sr] = randn32(sr) * 0.5
     
     res = signal.run((audio, sr))
     
@@ -3,19 +3,8 @@ Tests for the spectral audio detector.
 """
 
 import pytest
-import numpy as np
-from pathlib import Path
 from veridex.audio.spectral import SpectralSignal
-
-
-def _has_audio_deps() -> bool:
-    """Check if audio dependencies are installed."""
-    try:
-        import librosa
-        import soundfile
-        return True
-    except ImportError:
-        return False
+from tests.conftest import HAS_AUDIO_DEPS
 
 
 class TestSpectralSignal:
@@ -69,45 +58,46 @@ class TestSpectralSignal:
         assert result.error is not None
     
     @pytest.mark.skipif(
-        not _has_audio_deps(),
+        not HAS_AUDIO_DEPS,
         reason="Audio dependencies not installed"
     )
-    def test_synthetic_audio(self):
-        """Test with synthetic audio signal."""
-        # Create a temporary audio file
-        import tempfile
-        import soundfile as sf
+    def test_synthetic_audio(self, sine_440_16k_5s, spectral_tone_features):
+        """Test scoring of a synthetic 440 Hz sine wave from precomputed features."""
+        detector = SpectralSignal()
         
-        # Generate synthetic sine wave (5 seconds)
-        sr = 16000
-        duration = 5.0
-        t = np.linspace(0, duration, int(sr * duration))
-        audio = 0.5 * np.sin(2 * np.pi * 440 * t)  # 440 Hz sine wave
+        score = detector._compute_score(spectral_tone_features)
+        confidence = detector._estimate_confidence(sine_440_16k_5s, spectral_tone_features)
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            sf.write(f.name, audio, sr)
-            temp_path = f.name
+        assert 0.0 <= score <= 1.0
+        assert 0.0 <= confidence <= 1.0
         
-        try:
-            detector = SpectralSignal()
-            result = detector.run(temp_path)
-            
-            # Should return a result
-            assert 0.0 <= result.score <= 1.0
-            assert 0.0 <= result.confidence <= 1.0
-            assert result.error is None
-            
-            # Check metadata
-            assert "spectral_rolloff" in result.metadata
-            assert "high_freq_energy" in result.metadata
-            assert "high_freq_entropy" in result.metadata
-            
-        finally:
-            # Clean up
-            Path(temp_path).unlink()
+        # Check metadata
+        assert "spectral_rolloff" in spectral_tone_features
+        assert "high_freq_energy" in spectral_tone_features
+        assert "high_freq_entropy" in spectral_tone_features
+    
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        not HAS_AUDIO_DEPS,
+        reason="Audio dependencies not installed"
+    )
+    def test_synthetic_audio_end_to_end(self, synthetic_wav_path):
+        """Test the full run() pipeline on a synthetic 5 second 440 Hz sine wave."""
+        detector = SpectralSignal()
+        result = detector.run(str(synthetic_wav_path))
+        
+        # Should return a result
+        assert 0.0 <= result.score <= 1.0
+        assert 0.0 <= result.confidence <= 1.0
+        assert result.error is None
+        
+        # Check metadata
+        assert "spectral_rolloff" in result.metadata
+        assert "high_freq_energy" in result.metadata
+        assert "high_freq_entropy" in result.metadata
     
     @pytest.mark.skipif(
-        not _has_audio_deps(),
+        not HAS_AUDIO_DEPS,
         reason="Audio dependencies not installed"
     )
     def test_score_computation(self):
@@ -4,84 +4,58 @@ Tests for audio utility functions.
 
 import pytest
 import numpy as np
-from pathlib import Path
-
-
-def _has_audio_deps() -> bool:
-    """Check if audio dependencies are installed."""
-    try:
-        import librosa
-        import soundfile
-        return True
-    except ImportError:
-        return False
+from tests.conftest import HAS_AUDIO_DEPS
+from tests._rng import randn32
 
 
 class TestAudioUtils:
     """Test suite for audio utilities."""
     
     @pytest.mark.skipif(
-        not _has_audio_deps(),
+        not HAS_AUDIO_DEPS,
         reason="Audio dependencies not installed"
     )
-    def test_load_audio(self):
+    def test_load_audio(self, synthetic_wav_path):
         """Test audio loading."""
         from veridex.audio.utils import load_audio
-        import tempfile
-        import soundfile as sf
         
-        # Create test audio
-        sr = 16000
-        duration = 2.0
-        audio_data = np.random.randn(int(sr * duration)).astype(np.float32)
-        
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            sf.write(f.name, audio_data, sr)
-            temp_path = f.name
-        
-        try:
-            audio, loaded_sr = load_audio(temp_path, target_sr=16000)
-            
-            assert loaded_sr == 16000
-            assert len(audio) > 0
-            assert audio.dtype == np.float32
-            assert np.max(np.abs(audio)) <= 1.0  # Normalized
-            
-        finally:
-            Path(temp_path).unlink()
+        audio, loaded_sr = load_audio(synthetic_wav_path, target_sr=16000)
+        
+        assert loaded_sr == 16000
+        assert len(audio) > 0
+        assert audio.dtype == np.float32
+        assert np.max(np.abs(audio)) <= 1.0  # Normalized
     
+    @pytest.mark.slow
     @pytest.mark.skipif(
-        not _has_audio_deps(),
+        not HAS_AUDIO_DEPS,
         reason="Audio dependencies not installed"
     )
-    def test_extract_mel_spectrogram(self):
+    def test_extract_mel_spectrogram(self, sine_440_16k_5s):
         """Test mel-spectrogram extraction."""
         from veridex.audio.utils import extract_mel_spectrogram
         
-        # Create synthetic audio
+        # Create synthetic audio (1 second view of the cached tone)
         sr = 16000
-        duration = 1.0
-        t = np.linspace(0, duration, int(sr * duration))
-        audio = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+        audio = sine_440_16k_5s[:sr]
         
         mel_spec = extract_mel_spectrogram(audio, sr=sr, n_mels=128)
         
         assert mel_spec.shape[0] == 128  # n_mels
         assert mel_spec.shape[1] > 0  # time frames
     
+    @pytest.mark.slow
     @pytest.mark.skipif(
-        not _has_audio_deps(),
+        not HAS_AUDIO_DEPS,
         reason="Audio dependencies not installed"
     )
-    def test_extract_mfcc(self):
+    def test_extract_mfcc(self, sine_440_16k_5s):
         """Test MFCC extraction."""
         from veridex.audio.utils import extract_mfcc
         
-        # Create synthetic audio
+        # Create synthetic audio (1 second view of the cached tone)
         sr = 16000
-        duration = 1.0
-        t = np.linspace(0, duration, int(sr * duration))
-        audio = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+        audio = sine_440_16k_5s[:sr]
         
         mfcc = extract_mfcc(audio, sr=sr, n_mfcc=40)
         
@@ -89,7 +63,7 @@ class TestAudioUtils:
         assert mfcc.shape[1] > 0  # time frames
     
     @pytest.mark.skipif(
-        not _has_audio_deps(),
+        not HAS_AUDIO_DEPS,
         reason="Audio dependencies not installed"
     )
     def test_validate_audio(self):
@@ -99,13 +73,13 @@ class TestAudioUtils:
         sr = 16000
         
         # Valid audio
-        valid_audio = np.random.randn(sr * 2).astype(np.float32)  # 2 seconds
+        valid_audio = randn32(sr * 2)  # 2 seconds
         is_valid, error = validate_audio(valid_audio, sr)
         assert is_valid
         assert error is None
         
         # Too short
-        short_audio = np.random.randn(sr // 4).astype(np.float32)  # 0.25 seconds
+        short_audio = randn32(sr // 4)  # 0.25 seconds
         is_valid, error = validate_audio(short_audio, sr, min_duration=0.5)
         assert not is_valid
         assert "too short" in error.lower()
@@ -121,4 +95,17 @@ class TestAudioUtils:
         is_valid, error = validate_audio(invalid_audio, sr, min_duration=0.0)
         assert not is_valid
         assert "invalid" in error.lower()
-
+    
+    def test_compute_stft_matches_scipy(self):
+        """Test batched rfft STFT against scipy.signal.stft."""
+        from scipy.signal import stft
+        from veridex.audio.utils import compute_stft
+        
+        audio = randn32(12345)
+        _, _, expected = stft(audio, fs=16000, nperseg=512, noverlap=256)
+        
+        result = compute_stft(audio, n_fft=512, hop_length=256)
+        
+        assert result.shape == expected.shape
+        assert result.dtype == expected.dtype
+        np.testing.assert_allclose(result, expected, atol=1e-6)
@@ -4,8 +4,13 @@ Global pytest configuration and fixtures.
 This module sets up mocks for heavy dependencies at the session level
 to prevent import issues across all test modules.
 """
+import importlib.machinery
+import importlib.util
+import os
 import sys
+import types
 from unittest.mock import MagicMock
+import numpy as np
 import pytest
 
 
@@ -13,25 +18,25 @@ import pytest
 # These need to be set up early to avoid issues with transformers and other packages
 #that check for optional dependencies during import
 
-# Mock av with __spec__ to avoid transformers import issues
-if "av" not in sys.modules or not hasattr(sys.modules.get("av"), "__spec__"):
-    mock_av = MagicMock()
-    mock_av.__spec__ = MagicMock()
-    sys.modules["av"] = mock_av
-
-# Mock cv2 with __spec__ to avoid transformers import issues, but only if not installed
-try:
-    import cv2
-except ImportError:
-    # Only mock if cv2 is not installed
+# Stub av with __spec__ to avoid transformers import issues. Nothing reads its
+# attributes, so a plain module is enough and no MagicMock tree is built; the
+# spec must be set because find_spec raises on a sys.modules entry without one.
+if "av" not in sys.modules:
+    stub_av = types.ModuleType("av")
+    stub_av.__spec__ = importlib.machinery.ModuleSpec("av", None)
+    sys.modules["av"] = stub_av
+
+# Mock cv2 with __spec__ to avoid transformers import issues, but only if not installed.
+# find_spec probes for the package without importing it, so real installs of
+# cv2/torch/scipy are not loaded here just to decide whether to mock them.
+if importlib.util.find_spec("cv2") is None:
     mock_cv2 = MagicMock()
     mock_cv2.__spec__ = MagicMock()
     sys.modules["cv2"] = mock_cv2
 
 # Mock torch and torchvision with __spec__ to avoid transformers import issues
-try:
-    import torch
-except ImportError:
+HAS_TORCH = importlib.util.find_spec("torch") is not None
+if not HAS_TORCH:
     mock_torch = MagicMock()
     mock_torch.__spec__ = MagicMock()
     # Also mock submodules that video tests might need
@@ -41,19 +46,85 @@ except ImportError:
     sys.modules["torch.nn"] = mock_torch.nn
     sys.modules["torch.nn.functional"] = mock_torch.nn.functional
 
-try:
-    import torchvision
-except ImportError:
+if importlib.util.find_spec("torchvision") is None:
     mock_torchvision = MagicMock()
     mock_torchvision.__spec__ = MagicMock()
     sys.modules["torchvision"] = mock_torchvision
 
-# Try to import scipy - if not available, create a minimal mock with __version__
+# If scipy is not available, create a minimal mock with __version__
 # This allows sklearn imports to work while still allowing tests to patch specific functions
-try:
-    import scipy
-except ImportError:
-    # Only mock if scipy is not installed
+if importlib.util.find_spec("scipy") is None:
     mock_scipy = MagicMock()
     mock_scipy.__version__ = "1.11.0"
     sys.modules["scipy"] = mock_scipy
+
+# Probed once per session (without importing) for skipif markers in audio tests
+HAS_AUDIO_DEPS = all(
+    importlib.util.find_spec(name) is not None for name in ("librosa", "soundfile")
+)
+
+@pytest.fixture(scope="session", autouse=True)
+def _torch_inference_mode():
+    """Run the whole session without autograd and with a capped thread pool.
+
+    No test needs gradients, and under xdist every worker would otherwise
+    start one intra-op thread per core.
+    """
+    if not HAS_TORCH:
+        yield
+        return
+    import torch
+
+    torch.set_num_threads(min(4, os.cpu_count() or 1))
+    with torch.inference_mode():
+        yield
+
+
+@pytest.fixture
+def no_torch(monkeypatch):
+    """Make torch and transformers unimportable for one test.
+
+    A ``None`` entry in ``sys.modules`` makes ``import`` raise ImportError
+    directly, without intercepting every other import the test performs.
+    """
+    monkeypatch.setitem(sys.modules, "torch", None)
+    monkeypatch.setitem(sys.modules, "transformers", None)
+
+
+@pytest.fixture
+def no_c2pa(monkeypatch):
+    """Make c2pa unimportable for one test."""
+    monkeypatch.setitem(sys.modules, "c2pa", None)
+
+
+def _read_only_noise(n_samples, seed=0):
+    """Seeded float32 white noise, frozen so session fixtures can be shared safely."""
+    audio = np.random.default_rng(seed).standard_normal(n_samples, dtype=np.float32)
+    audio.setflags(write=False)
+    return audio
+
+
+@pytest.fixture(scope="session")
+def audio_32000_f32():
+    """2 seconds of noise at 16 kHz."""
+    return _read_only_noise(32000)
+
+
+@pytest.fixture(scope="session")
+def sine_440_16k_5s():
+    """5 seconds of a 440 Hz tone at 16 kHz; slice it for shorter clips."""
+    sr = 16000
+    t = np.arange(sr * 5, dtype=np.float32) * np.float32(1.0 / sr)
+    audio = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32, copy=False)
+    audio.setflags(write=False)
+    return audio
+
+
+@pytest.fixture(scope="session")
+def synthetic_wav_path(tmp_path_factory, sine_440_16k_5s):
+    """The cached 440 Hz tone written once to a WAV file for path-based loaders."""
+    import soundfile as sf
+
+    path = tmp_path_factory.mktemp("audio") / "tone.wav"
+    sf.write(path, sine_440_16k_5s, 16000)
+    return path
@@ -0,0 +1,29 @@
+import importlib
+import os
+from importlib.util import find_spec
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _compile_caches(pytestconfig):
+    """Persist torch.compile (Inductor/Triton) artifacts in the pytest cache."""
+    os.environ.setdefault(
+        "TORCHINDUCTOR_CACHE_DIR", str(pytestconfig.cache.mkdir("torchinductor"))
+    )
+    os.environ.setdefault("TRITON_CACHE_DIR", str(pytestconfig.cache.mkdir("triton")))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_tokenizers():
+    """Keep HF tokenizers single-threaded so xdist workers don't warn or oversubscribe."""
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_heavy_imports(_compile_caches, _quiet_tokenizers):
+    """Import the heavy example dependencies once for the whole session."""
+    for name in ("torch", "transformers", "PIL"):
+        if find_spec(name) is not None:
+            importlib.import_module(name)
+    yield
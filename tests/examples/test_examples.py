@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import pytest
+
+from tests.examples.utils import DEFAULT_TIMEOUT, run_example
+
+# (script path relative to examples/, timeout in seconds)
+SCRIPTS = [
+    ("text_detection_example.py", DEFAULT_TIMEOUT),
+    ("image_detection_example.py", DEFAULT_TIMEOUT),
+    ("audio_detection_example.py", DEFAULT_TIMEOUT),
+    ("advanced_multimodal_example.py", 180),
+    ("from_docs/tutorials/quick_start_examples.py", DEFAULT_TIMEOUT),
+    ("from_docs/tutorials/text_detection_examples.py", DEFAULT_TIMEOUT),
+    ("from_docs/tutorials/image_detection_examples.py", DEFAULT_TIMEOUT),
+    ("from_docs/tutorials/audio_detection_examples.py", DEFAULT_TIMEOUT),
+    ("from_docs/tutorials/ensemble_examples.py", DEFAULT_TIMEOUT),
+    ("from_docs/use_cases/essay_checker.py", DEFAULT_TIMEOUT),
+    ("from_docs/use_cases/fact_checker.py", DEFAULT_TIMEOUT),
+    ("from_docs/use_cases/content_moderator.py", DEFAULT_TIMEOUT),
+    ("from_docs/use_cases/compliance_scanner.py", DEFAULT_TIMEOUT),
+    ("from_docs/use_cases/dataset_curator.py", DEFAULT_TIMEOUT),
+    ("from_docs/use_cases/forensic_analyzer.py", 180),
+]
+
+
+@pytest.mark.parametrize(
+    "script, timeout", SCRIPTS, ids=[Path(script).stem for script, _ in SCRIPTS]
+)
+def test_example(script, timeout):
+    run_example(script, timeout=timeout)
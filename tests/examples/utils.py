@@ -1,39 +1,186 @@
-import subprocess
+import importlib
+import inspect
+import io
+import os
+import re
+import runpy
+import signal
 import sys
+import threading
 import pytest
+from collections import deque
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 
-def run_example_script(file_path: Path):
+# Only the tail of an example's output is kept for failure messages
+MAX_OUTPUT_LINES = 500
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "examples"
+
+# Most examples finish in seconds; heavy ones pass a larger timeout explicitly
+DEFAULT_TIMEOUT = 30
+
+
+class ExampleTimeout(BaseException):
+    """Raised inside a running example when its time budget is exhausted.
+
+    Derives from BaseException so `except Exception` blocks in examples
+    cannot swallow it.
     """
-    Run an example script as a subprocess and assert success.
-    
+
+
+def _raise_timeout(signum, frame):
+    raise ExampleTimeout()
+
+
+class _TailBuffer(io.TextIOBase):
+    """Text stream that retains only the last ``maxlen`` lines written."""
+
+    def __init__(self, maxlen: int = MAX_OUTPUT_LINES):
+        self._lines = deque(maxlen=maxlen)
+        self._partial = ""
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        *complete, self._partial = (self._partial + s).split("\n")
+        self._lines.extend(complete)
+        return len(s)
+
+    def getvalue(self):
+        return "\n".join([*self._lines, self._partial])
+
+
+_SIGNAL_PACKAGES = ("veridex.text", "veridex.image", "veridex.audio")
+
+# Matched against raw script bytes so sources are never decoded
+_FROM_PRETRAINED_RE = re.compile(rb'from_pretrained\(["\']([^"\']+)')
+_SIGNAL_CLASS_RE = re.compile(rb"\b(\w+Signal)\b")
+
+
+def _referenced_model_ids(file_path: Path):
+    """
+    Collect Hugging Face repo ids an example script will load.
+
+    Examples rarely call ``from_pretrained`` themselves; they instantiate
+    veridex signals, so the default ``*_id``/``*_name`` arguments of every
+    signal class named in the script are collected as well.
+    """
+    source = file_path.read_bytes()
+    model_ids = {m.decode("utf-8", "ignore") for m in _FROM_PRETRAINED_RE.findall(source)}
+
+    for class_name in {m.decode("ascii", "ignore") for m in _SIGNAL_CLASS_RE.findall(source)}:
+        for package in _SIGNAL_PACKAGES:
+            try:
+                cls = getattr(importlib.import_module(package), class_name, None)
+            except ImportError:
+                continue
+            if cls is None:
+                continue
+            for name, param in inspect.signature(cls.__init__).parameters.items():
+                if name.endswith(("_id", "_name")) and isinstance(param.default, str):
+                    model_ids.add(param.default)
+            break
+
+    return model_ids
+
+
+def _is_model_cached(repo_id: str) -> bool:
+    """Check whether a model repo has at least one snapshot in the HF hub cache."""
+    from huggingface_hub.constants import HF_HUB_CACHE
+
+    snapshots = Path(HF_HUB_CACHE) / f"models--{repo_id.replace('/', '--')}" / "snapshots"
+    return snapshots.is_dir() and any(snapshots.iterdir())
+
+
+def _skip_if_models_unavailable(file_path: Path):
+    """Skip instead of timing out when offline and a required model is not cached."""
+    if os.environ.get("HF_HUB_OFFLINE") != "1":
+        return
+    try:
+        import huggingface_hub  # noqa: F401
+    except ImportError:
+        return
+    for repo_id in sorted(_referenced_model_ids(file_path)):
+        if not _is_model_cached(repo_id):
+            pytest.skip(f"model {repo_id} not cached")
+
+
+def run_example_script(file_path: Path, timeout: int = DEFAULT_TIMEOUT):
+    """
+    Run an example script in-process as ``__main__`` and assert success.
+
+    The script shares the test interpreter, so torch/transformers and any
+    loaded model weights are imported once for the whole suite instead of
+    once per example.
+
     Args:
         file_path (Path): Absolute path to the script to run.
+        timeout (int): Seconds the script may run before the test fails.
+            Enforced with SIGALRM, so only on POSIX and in the main thread.
     """
     print(f"Testing example: {file_path}")
-    
+
     if not file_path.exists():
         pytest.fail(f"Example file not found: {file_path}")
 
+    _skip_if_models_unavailable(file_path)
+
+    # Capture output to avoid cluttering test logs unless there's a failure;
+    # model download logs and progress bars can be large, so keep only the tail
+    output = _TailBuffer()
+    saved_argv = sys.argv
+    saved_modules = set(sys.modules)
+    sys.argv = [str(file_path)]
+
+    use_alarm = (
+        hasattr(signal, "SIGALRM")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
     try:
-        # Run the script
-        # Capture output to avoid cluttering test logs unless there's a failure
-        result = subprocess.run(
-            [sys.executable, str(file_path)],
-            capture_output=True,
-            text=True,
-            # Some models might take time to download/load, providing generous timeout
-            timeout=180
+        with redirect_stdout(output), redirect_stderr(output):
+            runpy.run_path(str(file_path), run_name="__main__")
+    except ExampleTimeout:
+        pytest.fail(
+            f"Example timed out after {timeout} seconds: {file_path}\n\n"
+            f"OUTPUT:\n{output.getvalue()}"
         )
-        
-        if result.returncode != 0:
+    except SystemExit as e:
+        if e.code not in (None, 0):
             pytest.fail(
-                f"Example failed with return code {result.returncode}.\n\n"
-                f"STDOUT:\n{result.stdout}\n\n"
-                f"STDERR:\n{result.stderr}"
+                f"Example failed with exit code {e.code}.\n\n"
+                f"OUTPUT:\n{output.getvalue()}"
             )
-            
-    except subprocess.TimeoutExpired:
-        pytest.fail(f"Example timed out after 180 seconds: {file_path}")
     except Exception as e:
-        pytest.fail(f"Failed to run example {file_path}: {str(e)}")
+        pytest.fail(
+            f"Failed to run example {file_path}: {str(e)}\n\n"
+            f"OUTPUT:\n{output.getvalue()}"
+        )
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        sys.argv = saved_argv
+        # Drop modules imported from the examples tree so one script cannot
+        # leak state into the next; library imports (torch etc.) stay cached
+        examples_root = str(file_path.parent)
+        for name in set(sys.modules) - saved_modules:
+            module_file = getattr(sys.modules[name], "__file__", None) or ""
+            if module_file.startswith(examples_root):
+                del sys.modules[name]
+
+
+def run_example(name: str, timeout: int = DEFAULT_TIMEOUT):
+    """
+    Run a script given by its path relative to the top-level ``examples`` dir.
+
+    Args:
+        name (str): Relative script path, e.g. ``"from_docs/use_cases/essay_checker.py"``.
+        timeout (int): Seconds the script may run before the test fails.
+    """
+    run_example_script(EXAMPLES_DIR / name, timeout=timeout)
@@ -9,14 +9,47 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from veridex.image.frequency import FrequencySignal
+from veridex.image.dire import DIRESignal
 from veridex.core.signal import DetectionResult
+from tests._rng import random_image
+
+# Generated once at import and shared read-only by every test
+_GRAY_100 = random_image((100, 100))
+_RGB_512 = random_image((512, 512, 3))
+_BLACK_100 = np.zeros((100, 100), dtype=np.uint8)
+_BLACK_100.setflags(write=False)
+
+# DIRE's MAE on flat colours does not depend on resolution, so keep them tiny
+_DIRE_SIZE = 32
+_DIRE_WHITE = Image.new("RGB", (_DIRE_SIZE, _DIRE_SIZE), color="white")
+_DIRE_BLACK = Image.new("RGB", (_DIRE_SIZE, _DIRE_SIZE), color="black")
+
+
+class MockDIRESignal(DIRESignal):
+    """DIRESignal whose diffusion pipeline always returns `reconstruction`."""
+
+    def __init__(self, reconstruction, device="cpu", image_size=512):
+        super().__init__(device=device, image_size=image_size)
+        self.reconstruction = reconstruction
+
+    def check_dependencies(self):
+        pass
+
+    def _load_pipeline(self):
+        mock_pipeline = MagicMock()
+        mock_output = MagicMock()
+        mock_output.images = [self.reconstruction]
+        mock_pipeline.return_value = mock_output
+        return mock_pipeline
+
 
 class TestFrequencySignal(unittest.TestCase):
-    def setUp(self):
-        self.signal = FrequencySignal()
-        # Create a dummy image
-        self.img_array = np.random.randint(0, 255, (100, 100), dtype=np.uint8)
-        self.pil_image = Image.fromarray(self.img_array)
+    @classmethod
+    def setUpClass(cls):
+        # FrequencySignal is stateless, so one instance serves every test
+        cls.signal = FrequencySignal()
+        cls.img_array = _GRAY_100
+        cls.pil_image = Image.fromarray(_GRAY_100)
 
     def test_run_numpy(self):
         result = self.signal.run(self.img_array)
@@ -31,9 +64,9 @@ class TestFrequencySignal(unittest.TestCase):
 
     def test_high_freq_ratio_diff(self):
         # Create a smooth image (low freq)
-        smooth = np.zeros((100, 100), dtype=np.uint8)
+        smooth = _BLACK_100
         # Create a noise image (high freq)
-        noise = np.random.randint(0, 255, (100, 100), dtype=np.uint8)
+        noise = _GRAY_100
 
         res_smooth = self.signal.run(smooth)
         res_noise = self.signal.run(noise)
@@ -44,34 +77,11 @@ class TestFrequencySignal(unittest.TestCase):
 
 class TestDIRESignal(unittest.TestCase):
     def test_dire_run(self):
-        # Since imports are inside methods, we can't easily patch the classes directly
-        # unless we ensure the module uses the mocked modules.
-        # But we are in the same process.
-
-        # Strategy: Mock `importlib.import_module` or similar? No, too complex.
-        # Strategy: Create a subclass that mocks _load_pipeline.
-
-        from veridex.image.dire import DIRESignal
-
-        class MockDIRESignal(DIRESignal):
-            def check_dependencies(self):
-                pass
-
-            def _load_pipeline(self):
-                # Return a mock pipeline
-                mock_pipeline = MagicMock()
-                mock_output = MagicMock()
-                # Return black image
-                mock_output.images = [Image.new("RGB", (512, 512), color="black")]
-                mock_pipeline.return_value = mock_output
-                return mock_pipeline
-
-        signal = MockDIRESignal(device="cpu")
+        # Pipeline returns a black image, input is white: maximal error
+        signal = MockDIRESignal(_DIRE_BLACK, image_size=_DIRE_SIZE)
 
         # Run on a white image
-        input_img = Image.new("RGB", (512, 512), color="white")
-
-        result = signal.run(input_img)
+        result = signal.run(_DIRE_WHITE)
 
         if result.error:
             print(f"Test failed with error: {result.error}")
@@ -82,56 +92,24 @@ class TestDIRESignal(unittest.TestCase):
 
     def test_dire_initialization(self):
         """Test DIRE signal initialization."""
-        from veridex.image.dire import DIRESignal
-        
         signal = DIRESignal(device="cpu")
         self.assertEqual(signal.device, "cpu")
 
     def test_dire_properties(self):
         """Test DIRE signal properties."""
-        from veridex.image.dire import DIRESignal
-        
         signal = DIRESignal()
         self.assertEqual(signal.name, "dire_reconstruction")
         self.assertEqual(signal.dtype, "image")
 
     def test_dire_numpy_array_input(self):
         """Test DIRE with numpy array input."""
-        from veridex.image.dire import DIRESignal
-        
-        class MockDIRESignal(DIRESignal):
-            def check_dependencies(self):
-                pass
-            
-            def _load_pipeline(self):
-                mock_pipeline = MagicMock()
-                mock_output = MagicMock()
-                mock_output.images = [Image.new("RGB", (512, 512), color="gray")]
-                mock_pipeline.return_value = mock_output
-                return mock_pipeline
-        
-        signal = MockDIRESignal(device="cpu")
-        img_array = np.random.randint(0, 256, (512, 512, 3), dtype=np.uint8)
-        
-        result = signal.run(img_array)
+        signal = MockDIRESignal(Image.new("RGB", (512, 512), color="gray"))
+        result = signal.run(_RGB_512)
         self.assertIsInstance(result, DetectionResult)
 
     def test_dire_small_image(self):
         """Test DIRE with smaller image."""
-        from veridex.image.dire import DIRESignal
-        
-        class MockDIRESignal(DIRESignal):
-            def check_dependencies(self):
-                pass
-            
-            def _load_pipeline(self):
-                mock_pipeline = MagicMock()
-                mock_output = MagicMock()
-                mock_output.images = [Image.new("RGB", (256, 256), color="red")]
-                mock_pipeline.return_value = mock_output
-                return mock_pipeline
-        
-        signal = MockDIRESignal(device="cpu")
+        signal = MockDIRESignal(Image.new("RGB", (256, 256), color="red"))
         input_img = Image.new("RGB", (256, 256), color="blue")
         
         result = signal.run(input_img)
@@ -139,23 +117,9 @@ class TestDIRESignal(unittest.TestCase):
 
     def test_dire_score_bounds(self):
         """Test that DIRE score stays within bounds."""
-        from veridex.image.dire import DIRESignal
-        
-        class MockDIRESignal(DIRESignal):
-            def check_dependencies(self):
-                pass
-            
-            def _load_pipeline(self):
-                mock_pipeline =MagicMock()
-                mock_output = MagicMock()
-                mock_output.images = [Image.new("RGB", (512, 512), color="black")]
-                mock_pipeline.return_value = mock_output
-                return mock_pipeline
-        
-        signal = MockDIRESignal(device="cpu")
-        input_img = Image.new("RGB", (512, 512), color="white")
-        
-        result = signal.run(input_img)
+        signal = MockDIRESignal(_DIRE_BLACK, image_size=_DIRE_SIZE)
+
+        result = signal.run(_DIRE_WHITE)
         self.assertTrue(0.0 <= result.score <= 1.0)
         self.assertTrue(0.0 <= result.confidence <= 1.0)
 
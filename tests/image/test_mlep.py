@@ -1,12 +1,24 @@
+import importlib.util
 import unittest
 from unittest.mock import MagicMock, patch
 import numpy as np
 from veridex.image.mlep import MLEPSignal
 from veridex.core.signal import DetectionResult
+from tests._rng import random_image
+
+# Probed once (without importing) for the tests that run the real pipeline
+_HAS_DEPS = all(importlib.util.find_spec(name) is not None for name in ("skimage", "scipy"))
+
+# Generated once at import and shared read-only by every test
+_GRAY_100 = random_image((100, 100))
+_RGB_10 = random_image((10, 10, 3))
+_RGB_100 = random_image((100, 100, 3))
+_RGB_500 = random_image((500, 500, 3))
 
 class TestMLEPSignal(unittest.TestCase):
-    def setUp(self):
-        self.signal = MLEPSignal()
+    @classmethod
+    def setUpClass(cls):
+        cls.signal = MLEPSignal()
 
     def test_initialization(self):
         self.assertEqual(self.signal.name, "mlep_entropy")
@@ -17,23 +29,13 @@ class TestMLEPSignal(unittest.TestCase):
         self.assertEqual(self.signal.name, "mlep_entropy")
         self.assertEqual(self.signal.dtype, "image")
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_run_statistics(self):
         # Create a dummy synthetic image (checkerboard)
         # 100x100
         image = np.zeros((100, 100, 3), dtype=np.uint8)
         image[::2, ::2, :] = 255
 
-        # We need to ensure dependencies are present or mock them.
-        # Since standard env likely has numpy/scipy/skimage, we try running it directly.
-        # If it fails due to missing deps in the minimal env, we mock.
-
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            print("Skipping MLEP logic test due to missing dependencies")
-            return
-
         result = self.signal.run(image)
 
         self.assertEqual(result.error, None)
@@ -67,61 +69,41 @@ class TestMLEPSignal(unittest.TestCase):
             self.assertIsNotNone(result.error)
             self.assertEqual(result.score, 0.0)
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_run_grayscale_image(self):
         """Test run with grayscale image."""
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
         # Create grayscale image
-        image = np.random.randint(0, 256, (100, 100), dtype=np.uint8)
+        image = _GRAY_100
         
         result = self.signal.run(image)
         
         self.assertIsInstance(result, DetectionResult)
         # Should handle grayscale images
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_run_small_image(self):
         """Test run with very small image."""
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
         # Create tiny image
-        image = np.random.randint(0, 256, (10, 10, 3), dtype=np.uint8)
+        image = _RGB_10
         
         result = self.signal.run(image)
         
         self.assertIsInstance(result, DetectionResult)
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_run_large_image(self):
         """Test run with large image."""
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
         # Create larger image
-        image = np.random.randint(0, 256, (500, 500, 3), dtype=np.uint8)
+        image = _RGB_500
         
         result = self.signal.run(image)
         
         self.assertIsInstance(result, DetectionResult)
         self.assertIn("mean_entropy", result.metadata)
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_run_uniform_image(self):
         """Test run with uniform (solid color) image."""
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
         # Create uniform image (all white)
         image = np.ones((100, 100, 3), dtype=np.uint8) * 255
         
@@ -130,16 +112,11 @@ class TestMLEPSignal(unittest.TestCase):
         self.assertIsInstance(result, DetectionResult)
         # Uniform images should have low entropy
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_run_high_entropy_image(self):
         """Test run with high entropy (random) image."""
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
         # Create random noise image (high entropy)
-        image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        image = _RGB_100
         
         result = self.signal.run(image)
         
@@ -148,31 +125,21 @@ class TestMLEPSignal(unittest.TestCase):
             # High entropy images should have higher mean_entropy
             self.assertIn("mean_entropy", result.metadata)
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_run_basic_execution(self):
         """Test basic execution path."""
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
         # Create simple test image
-        image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        image = _RGB_100
         result = self.signal.run(image)
         
         self.assertIsInstance(result, DetectionResult)
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_score_computation_high_entropy(self):
         """Test that high entropy variance leads to higher AI detection score."""
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
         # Create image that produces high variance across layers
         # This simulates AI-generated patterns
-        image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        image = _RGB_100
         
         result = self.signal.run(image)
         
@@ -201,15 +168,11 @@ class TestMLEPSignal(unittest.TestCase):
             self.assertIsNotNone(result.error)
             self.assertEqual(result.score, 0.0)
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_run_pil_image(self):
         """Test run with PIL Image object."""
-        try:
-            import skimage
-            import scipy
-            from PIL import Image
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
+        from PIL import Image
+
         # Create PIL image
         pil_img = Image.new('RGB', (100, 100), color='red')
         
@@ -217,15 +180,10 @@ class TestMLEPSignal(unittest.TestCase):
         
         self.assertIsInstance(result, DetectionResult)
 
+    @unittest.skipUnless(_HAS_DEPS, "skimage/scipy missing")
     def test_metadata_completeness(self):
         """Test that metadata contains expected fields."""
-        try:
-            import skimage
-            import scipy
-        except ImportError:
-            self.skipTest("Missing dependencies")
-        
-        image = np.random.randint(0, 256, (100, 100, 3), dtype=np.uint8)
+        image = _RGB_100
         result = self.signal.run(image)
         
         if result.error is None:
@@ -3,6 +3,13 @@ from veridex.core.signal import BaseSignal, DetectionResult
 from veridex.eval import evaluate_signal, EvaluationDataset
 from veridex.eval.metrics import calculate_metrics
 
+# Fixed scores per input for predictability; anything else is uncertain
+_MOCK_SCORES = {
+    "ai text": DetectionResult(score=0.9, confidence=1.0),
+    "human text": DetectionResult(score=0.1, confidence=1.0),
+}
+_UNCERTAIN = DetectionResult(score=0.5, confidence=0.5)
+
 class MockSignal(BaseSignal):
     @property
     def name(self):
@@ -13,13 +20,18 @@ class MockSignal(BaseSignal):
         return "text"
 
     def run(self, input_data):
-        # Determine score based on input content for predictability
-        if "ai" in input_data:
-            return DetectionResult(score=0.9, confidence=1.0)
-        elif "human" in input_data:
-            return DetectionResult(score=0.1, confidence=1.0)
-        else:
-            return DetectionResult(score=0.5, confidence=0.5)
+        return _MOCK_SCORES.get(input_data, _UNCERTAIN)
+
+class MockBatchSignal(MockSignal):
+    def __init__(self):
+        self.batch_calls = 0
+
+    def run(self, input_data):
+        raise AssertionError("per-sample run() should not be used when run_batch exists")
+
+    def run_batch(self, inputs):
+        self.batch_calls += 1
+        return [_MOCK_SCORES.get(x, _UNCERTAIN) for x in inputs]
 
 class TestEvaluationFramework(unittest.TestCase):
     def test_metrics_calculation(self):
@@ -58,5 +70,16 @@ class TestEvaluationFramework(unittest.TestCase):
         metrics = results["metrics"]
         self.assertAlmostEqual(metrics["accuracy"], 2/3, places=2)
 
+        # The batched path must produce the same metrics from a single call
+        batch_signal = MockBatchSignal()
+        batch_results = evaluate_signal(batch_signal, data)
+        self.assertEqual(batch_signal.batch_calls, 1)
+        self.assertEqual(batch_results["num_errors"], 0)
+        batch_metrics = dict(batch_results["metrics"])
+        batch_metrics.pop("throughput")
+        metrics = dict(metrics)
+        metrics.pop("throughput")
+        self.assertEqual(batch_metrics, metrics)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,8 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 import sys
 import numpy as np
+import pytest
 
 from veridex.text.perplexity import PerplexitySignal
 from veridex.text.binoculars import BinocularsSignal
@@ -10,26 +11,9 @@ from veridex.core.signal import DetectionResult
 class TestNewSignals(unittest.TestCase):
 
     def test_perplexity_burstiness_logic_mocked(self):
-        # This mirrors the logic in the deleted file but integrated into the proper test structure
-        # We subclass to override _load_model safely
-        class MockPerplexitySignal(PerplexitySignal):
-            def _load_model(self):
-                self._model = MagicMock()
-                self._tokenizer = MagicMock()
-                self._device = "cpu"
-
-            def run(self, input_data):
-                # We want to test the full run logic if possible, but mocking torch calls is tedious.
-                # However, since we already tested the logic in test_text_signals.py with mocking,
-                # we can use this to test the Burstiness splitting specifically if we want,
-                # or rely on the other test.
-                # Let's trust test_text_signals.py for the full run and just test splitting here.
-                return super().run(input_data)
-
-        # Testing split sentences
-        signal = PerplexitySignal()
+        # Sentence splitting is a static helper, so no signal instance is needed
         text = "Hello world. This is a test."
-        sentences = signal._split_sentences(text)
+        sentences = PerplexitySignal._split_sentences(text)
         self.assertEqual(len(sentences), 2)
         self.assertEqual(sentences[0], "Hello world.")
         self.assertEqual(sentences[1], "This is a test.")
@@ -70,16 +54,15 @@ class TestNewSignals(unittest.TestCase):
         # Should not raise any error
         signal.check_dependencies()
 
+    @pytest.mark.usefixtures("no_torch")
     def test_binoculars_check_dependencies_missing(self):
         """Test dependency check when torch/transformers are missing."""
         signal = BinocularsSignal(use_mock=False)
-        
-        with patch.dict('sys.modules', {'torch': None, 'transformers': None}):
-            with patch('builtins.__import__', side_effect=ImportError):
-                with self.assertRaises(ImportError) as context:
-                    signal.check_dependencies()
-                
-                self.assertIn("transformers", str(context.exception).lower())
+
+        with self.assertRaises(ImportError) as context:
+            signal.check_dependencies()
+
+        self.assertIn("transformers", str(context.exception).lower())
 
     def test_binoculars_load_models_basic(self):
         """Test that load_models can be called."""
@@ -26,17 +26,15 @@ class TestC2PASignal:
         signal = C2PASignal()
         assert signal.dtype == "file"
 
-    def test_check_dependencies_missing(self):
+    def test_check_dependencies_missing(self, no_c2pa):
         """Test dependency check when c2pa is not installed."""
         signal = C2PASignal()
-        
-        with patch.dict('sys.modules', {'c2pa': None}):
-            with patch('builtins.__import__', side_effect=ImportError):
-                with pytest.raises(ImportError) as exc_info:
-                    signal.check_dependencies()
-                
-                assert "c2pa" in str(exc_info.value).lower()
-                assert "pip install c2pa-python" in str(exc_info.value)
+
+        with pytest.raises(ImportError) as exc_info:
+            signal.check_dependencies()
+
+        assert "c2pa" in str(exc_info.value).lower()
+        assert "pip install c2pa-python" in str(exc_info.value)
 
     def test_check_dependencies_success(self):
         """Test dependency check when c2pa is installed."""
@@ -63,18 +61,16 @@ class TestC2PASignal:
         assert result.score == 0.0
         assert result.error is not None
 
-    def test_run_missing_dependencies(self):
+    def test_run_missing_dependencies(self, no_c2pa):
         """Test run when c2pa is not installed."""
         signal = C2PASignal()
-        
-        with patch.dict('sys.modules', {'c2pa': None}):
-            with patch('builtins.__import__', side_effect=ImportError):
-                result = signal.run("test.jpg")
-                
-                assert isinstance(result, DetectionResult)
-                assert result.score == 0.0
-                assert result.confidence == 0.0
-                assert "c2pa-python not installed" in result.error
+
+        result = signal.run("test.jpg")
+
+        assert isinstance(result, DetectionResult)
+        assert result.score == 0.0
+        assert result.confidence == 0.0
+        assert "c2pa-python not installed" in result.error
 
     def test_run_no_manifest(self):
         """Test run when file has no C2PA manifest."""
@@ -103,10 +99,40 @@ class TestC2PASignal:
         # Either error due to missing library or file not found
         assert result.error is not None or result.score >= 0
 
+    def test_run_batch_matches_run(self):
+        """Test that run_batch returns the same results as run, in order."""
+        signal = C2PASignal()
 
+        mock_c2pa = MagicMock()
+        mock_c2pa.read_json.side_effect = lambda path: None if path == "plain.jpg" else '{"assertions": []}'
 
+        with patch.dict('sys.modules', {'c2pa': mock_c2pa}):
+            paths = ["plain.jpg", "signed.jpg", 123]
+            batch = signal.run_batch(paths)
+            single = [signal.run(p) for p in paths]
 
+        assert batch == single
+        assert batch[0].metadata["status"] == "no_manifest"
+        assert batch[1].metadata["manifest_found"] is True
+        assert "Input must be a file path string" in batch[2].error
 
+    def test_run_batch_threaded_preserves_order(self):
+        """Test that a threaded run_batch returns results in input order."""
+        signal = C2PASignal()
+
+        mock_c2pa = MagicMock()
+        mock_c2pa.read_json.side_effect = lambda path: None if path.startswith("plain") else '{"assertions": []}'
+
+        paths = ["plain0.jpg", "signed1.jpg", 2, "plain3.jpg", "signed4.jpg"]
+        with patch.dict('sys.modules', {'c2pa': mock_c2pa}):
+            serial = signal.run_batch(paths)
+            threaded = signal.run_batch(paths, max_workers=4)
 
+        assert threaded == serial
 
+    def test_run_batch_missing_dependencies(self, no_c2pa):
+        """Test run_batch when c2pa is not installed."""
+        results = C2PASignal().run_batch(["a.jpg", "b.jpg"])
 
+        assert len(results) == 2
+        assert all("c2pa-python not installed" in r.error for r in results)
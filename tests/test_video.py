@@ -1,102 +1,125 @@
-import unittest
-from unittest.mock import MagicMock, patch
-import sys
+import importlib
+from contextlib import ExitStack
+from unittest.mock import patch
+
 import numpy as np
-import os
+import pytest
 
 # NOTE: All global mocks (torch, torchvision, cv2, av, scipy, librosa) are handled in conftest.py
 # This ensures consistent mocking across all test files and prevents import issues
 
-# Import signals (will need to import them inside test or after mocks if they rely on top-level imports)
-# Since we are implementing them, we will ensure they use lazy imports or handle top-level imports gracefully.
-# For now, we assume the classes will be available in veridex.video
-
-class TestVideoSignals(unittest.TestCase):
-
-    def setUp(self):
-        # Create a dummy video file
-        self.dummy_video_path = "dummy_video.mp4"
-        with open(self.dummy_video_path, "w") as f:
-            f.write("dummy content")
-
-    def tearDown(self):
-        if os.path.exists(self.dummy_video_path):
-            os.remove(self.dummy_video_path)
-
-    def test_rppg_signal_structure(self):
-        """Test the RPPGSignal interface and logic flow."""
-        # We need to import inside to ensure mocks are active if we had real imports
-        from veridex.video.rppg import RPPGSignal
-
-        signal = RPPGSignal()
-        self.assertEqual(signal.name, "rppg_physnet")
-        self.assertEqual(signal.dtype, "video")
-
-        # Mock the run methods
-        with patch.object(signal, '_load_video_frames') as mock_load, \
-             patch.object(signal, '_detect_faces') as mock_face, \
-             patch.object(signal, '_extract_signal') as mock_extract, \
-             patch.object(signal, '_analyze_psd') as mock_psd:
-
-            mock_load.return_value = np.zeros((30, 128, 128, 3)) # 30 frames
-            mock_face.return_value = [np.zeros((30, 64, 64, 3))] # 1 face track
-            # Updated: _extract_signal now returns (signal, weights_loaded)
-            mock_extract.return_value = (np.sin(np.linspace(0, 10, 30)), False) # Signal + untrained
-
-            # Case 1: Fake
-            # Return tuple (score, metadata)
-            mock_psd.return_value = (0.8, {"snr": 0.1, "peak_ratio": 1.0})
-
-            result = signal.run(self.dummy_video_path)
-            # Check if result.error is set, which would indicate a crash
-            if result.error:
-                print(f"RPPG Error: {result.error}")
-
-            self.assertEqual(result.score, 0.8)
-            self.assertIn('snr', result.metadata)
-
-    def test_i3d_signal_structure(self):
-        """Test the I3DSignal interface."""
-        from veridex.video.i3d import I3DSignal
-
-        signal = I3DSignal()
-        self.assertEqual(signal.name, "spatiotemporal_i3d")
-        self.assertEqual(signal.dtype, "video")
-
-        with patch.object(signal, '_load_clip') as mock_load, \
-             patch.object(signal, '_run_inference') as mock_inf:
-
-            mock_load.return_value = np.zeros((64, 224, 224, 3))
-            # Updated: _run_inference now returns (score, weights_loaded)
-            mock_inf.return_value = (0.95, True) # Confidently AI, trained model
-
-            result = signal.run(self.dummy_video_path)
-            if result.error:
-                print(f"I3D Error: {result.error}")
-
-            self.assertEqual(result.score, 0.95)
-            # Confidence is dynamic now, just check it exists and is reasonable
-            self.assertGreater(result.confidence, 0.7)  # Should be high for trained model
-
-    def test_lipsync_signal_structure(self):
-        """Test the LipSyncSignal interface."""
-        from veridex.video.lipsync import LipSyncSignal
-
-        signal = LipSyncSignal()
-        self.assertEqual(signal.name, "lipsync_wav2lip")
-        self.assertEqual(signal.dtype, "video")
-
-        with patch.object(signal, '_calculate_av_offset') as mock_offset:
-            # Updated: _calculate_av_offset now returns (offset, weights_loaded)
-            mock_offset.return_value = (2.0, True)  # High offset, trained model
-            # In code: if offset > 0.8 -> score = (2.0 - 0.8) / 1.0 = 1.0 (capped)
-
-            result = signal.run(self.dummy_video_path)
-            if result.error:
-                print(f"LipSync Error: {result.error}")
-
-            self.assertEqual(result.score, 1.0)
-            self.assertIn("av_distance", result.metadata)
-
-if __name__ == '__main__':
-    unittest.main() 
+# Mocked return values, built once at import; the signals only read them
+_RPPG_BVP = np.sin(np.linspace(0, 10, 30))
+_RPPG_BVP.setflags(write=False)
+_RPPG_PSD = (0.8, {"snr": 0.1, "peak_ratio": 1.0})
+# (T, 3) mean-RGB face trace with some colour variation
+_RPPG_TRACE = np.stack([_RPPG_BVP.astype(np.float32)] * 3, axis=1) + np.float32(100)
+_RPPG_TRACE.setflags(write=False)
+_I3D_INFERENCE = (0.95, True)
+_LIPSYNC_SEGMENTS = [
+    (np.broadcast_to(np.float32(0), (13, 20)), np.broadcast_to(np.float32(0), (112, 112, 15)))
+] * 3
+_LIPSYNC_OFFSETS = ([2.0, 2.0, 2.0], True)
+
+# Every loader is patched, so the path is never opened and no file is needed
+DUMMY_VIDEO_PATH = "dummy_video.mp4"
+
+
+def _patch_returns(obj, **return_values):
+    """Patch each named method of ``obj`` to return the given value, in one stack."""
+    with ExitStack() as stack:
+        for name, value in return_values.items():
+            stack.enter_context(patch.object(obj, name, return_value=value))
+        return stack.pop_all()
+
+
+# (signal class path, expected name, patched method -> return value,
+#  expected score, metadata key that must be present, exclusive minimum confidence)
+SIGNAL_CASES = [
+    pytest.param(
+        "veridex.video.rppg.RPPGSignal",
+        "rppg_physnet",
+        {
+            "_load_video_frames": np.broadcast_to(np.float32(0), (30, 128, 128, 3)), # 30 frames, zero-stride
+            "_detect_faces": _RPPG_TRACE, # 1 face track, reduced to its RGB trace
+            # _extract_signal returns (signal, method): CHROM fallback, no trained weights
+            "_extract_signal": (_RPPG_BVP, "chrom"),
+            # Fake: _analyze_psd returns (score, metadata)
+            "_analyze_psd": _RPPG_PSD,
+        },
+        0.8,
+        "snr",
+        None,
+        id="rppg",
+    ),
+    pytest.param(
+        "veridex.video.i3d.I3DSignal",
+        "spatiotemporal_i3d",
+        {
+            "_load_clip": np.broadcast_to(np.float32(0), (64, 224, 224, 3)),
+            # _run_inference returns (score, weights_loaded): confidently AI, trained model
+            "_run_inference": _I3D_INFERENCE,
+        },
+        0.95,
+        None,
+        0.7, # Should be high for trained model
+        id="i3d",
+    ),
+    pytest.param(
+        "veridex.video.lipsync.LipSyncSignal",
+        "lipsync_wav2lip",
+        # _calculate_av_offsets returns (offsets, weights_loaded): high offsets, trained model
+        # In code: if mean offset > 0.8 -> score = (2.0 - 0.8) / 1.0 = 1.0 (capped)
+        {"_load_segments": _LIPSYNC_SEGMENTS, "_calculate_av_offsets": _LIPSYNC_OFFSETS},
+        1.0,
+        "av_distance",
+        None,
+        id="lipsync",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "class_path, expected_name, return_values, expected_score, metadata_key, min_confidence",
+    SIGNAL_CASES,
+)
+def test_signal_structure(
+    class_path, expected_name, return_values, expected_score, metadata_key, min_confidence
+):
+    """Each video signal exposes its interface and turns patched stage outputs into a result."""
+    # Imported inside the test so the conftest mocks are active first
+    module_name, class_name = class_path.rsplit(".", 1)
+    signal = getattr(importlib.import_module(module_name), class_name)()
+
+    assert signal.name == expected_name
+    assert signal.dtype == "video"
+
+    with _patch_returns(signal, **return_values):
+        result = signal.run(DUMMY_VIDEO_PATH)
+
+    # A set error would indicate a crash inside run()
+    assert result.error is None, result.error
+    assert result.score == expected_score
+    if metadata_key is not None:
+        assert metadata_key in result.metadata
+    if min_confidence is not None:
+        assert result.confidence > min_confidence
+
+
+def test_rppg_without_face_is_not_confident():
+    """A video with no detectable face yields an error, not a confident verdict."""
+    from veridex.video.processing import FaceDetector
+    from veridex.video.rppg import RPPGSignal
+
+    signal = RPPGSignal()
+    detector = FaceDetector(backend="haar")
+    frames = np.zeros((300, 64, 64, 3), dtype=np.uint8)
+
+    with _patch_returns(
+        signal, _load_video_frames=frames, _get_detector=detector, _load_model=(None, False)
+    ), patch.object(detector, "detect", return_value=[]):
+        result = signal.run(DUMMY_VIDEO_PATH)
+
+    assert result.error is not None
+    assert result.score == 0.5
+    assert result.confidence == 0.0
@@ -1,70 +1,80 @@
+import importlib.util
 import unittest
 import os
+import shutil
+import tempfile
 import numpy as np
 import pytest
 from unittest.mock import patch
+from tests._rng import RNG
 
-# Skip if dependencies are missing
-try:
-    import torch
-    import cv2
-    import soundfile as sf
-    import librosa
-    from veridex.video.rppg import RPPGSignal
-    from veridex.video.i3d import I3DSignal
-    from veridex.video.lipsync import LipSyncSignal
-    HAS_DEPS = True
-except ImportError:
-    HAS_DEPS = False
+# Skip if dependencies are missing. Probed without importing, so collecting
+# (or deselecting) this module does not pay for torch/cv2/librosa; the heavy
+# imports happen in setUpClass and the tests themselves.
+HAS_DEPS = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("torch", "cv2", "soundfile", "librosa")
+)
+
+if not HAS_DEPS:
+    pytest.skip("Video dependencies not installed", allow_module_level=True)
 
-@pytest.mark.skipif(not HAS_DEPS, reason="Video dependencies not installed")
 class TestVideoIntegration(unittest.TestCase):
-    def setUp(self):
-        self.video_path = "integration_test.mp4"
-        self.audio_path = "integration_test.wav"
-        
+    @classmethod
+    def setUpClass(cls):
+        import cv2
+        import soundfile as sf
+
+        # The tests only read these files, so encode them once per class into a
+        # private directory (safe when xdist spreads the methods over workers)
+        cls.tmp_dir = tempfile.mkdtemp(prefix="veridex_video_")
+        cls.video_path = os.path.join(cls.tmp_dir, "integration_test.mp4")
+        cls.audio_path = os.path.join(cls.tmp_dir, "integration_test.wav")
+
         # 1. Create Video
         # 30 frames, 512x512
-        writer = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*'mp4v'), 30, (512, 512))
-        for i in range(30):
+        writer = cv2.VideoWriter(cls.video_path, cv2.VideoWriter_fourcc(*'mp4v'), 30, (512, 512))
+        # One frame buffer, cleared and redrawn for each frame
+        img = np.empty((512, 512, 3), dtype=np.uint8)
+        # Moving box shifted one pixel per frame, to give tracking some motion
+        moving_boxes = [((200 + i, 200), (300 + i, 300)) for i in range(30)]
+        for top_left, bottom_right in moving_boxes:
+            img.fill(0)
             # Face at center (200, 200) size 100x100
-            img = np.zeros((512, 512, 3), dtype=np.uint8)
             cv2.rectangle(img, (200, 200), (300, 300), (200, 200, 200), -1)
-            # Add some "noise" or movement to test tracking? 
-            # Shift slightly
-            shift = int(i * 1.0)
-            cv2.rectangle(img, (200 + shift, 200), (300 + shift, 300), (100, 100, 100), -1)
+            cv2.rectangle(img, top_left, bottom_right, (100, 100, 100), -1)
             writer.write(img)
         writer.release()
         
         # 2. Create Audio
         # 1 sec
         sr = 16000
-        audio = np.random.uniform(-0.1, 0.1, size=(sr,))
-        sf.write(self.audio_path, audio, sr)
+        audio = (RNG.random(sr, dtype=np.float32) - np.float32(0.5)) * np.float32(0.2)
+        sf.write(cls.audio_path, audio, sr)
 
-    def tearDown(self):
-        if os.path.exists(self.video_path):
-            os.remove(self.video_path)
-        if os.path.exists(self.audio_path):
-            os.remove(self.audio_path)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
 
     def test_rppg(self):
+        from veridex.video.rppg import RPPGSignal
+
         signal = RPPGSignal()
-        # Mock download to avoid network
-        with patch('veridex.utils.downloads.download_file'):
-             # Also mock loading weights to just return (don't load anything / use random)
-             # But we want to test model FORWARD. 
-             # So we let it try to load, fail, and use random weights.
+        # Mock download to avoid network; without weights the CHROM path runs.
+        # Haar does not see the flat synthetic "face", so pin the detector to
+        # the box region (which includes the moving inner box)
+        with patch('veridex.utils.downloads.download_file'), \
+                patch('veridex.video.processing.FaceDetector.detect', return_value=[(200, 200, 130, 100)]):
              result = signal.run(self.video_path)
         
         print(f"RPPG Result: {result}")
-        if result.error:
-            print(f"RPPG Error: {result.error}")
+        self.assertIsNone(result.error, result.error)
         self.assertGreaterEqual(result.confidence, 0.0)
         self.assertIn("snr", result.metadata)
 
     def test_i3d(self):
+        from veridex.video.i3d import I3DSignal
+
         signal = I3DSignal()
         with patch('veridex.utils.downloads.download_file'):
             result = signal.run(self.video_path)
@@ -78,14 +88,17 @@ class TestVideoIntegration(unittest.TestCase):
             self.assertGreaterEqual(result.confidence, 0.0)
 
     def test_lipsync(self):
+        import soundfile as sf
+        from veridex.video.lipsync import LipSyncSignal
+
         signal = LipSyncSignal()
         # LipSync needs audio in the video file.
         # Ours `video_path` has no audio track.
         # Librosa might fail to load audio from mp4 if no audio stream.
-        # Let's Mock `_calculate_av_offset` to use our `audio_path` instead?
+        # Let's Mock `_load_segments` to use our `audio_path` instead?
         # OR just mock librosa.load to return our data.
         
-        # But `_calculate_av_offset` does `librosa.load(path)`.
+        # But `_load_segments` does `librosa.load(path)`.
         # If path is video file, it tries to extract audio.
         # We can just test that it handles "no audio" gracefully or mock it.
         
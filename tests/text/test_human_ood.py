@@ -1,67 +1,88 @@
 
+import itertools
 import torch
 import unittest
 import numpy as np
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 from veridex.text.human_ood import HumanOODSignal
 
-class TestHumanOOD(unittest.TestCase):
-    def setUp(self):
-        self.signal = HumanOODSignal(
-            model_name="gpt2",
-            n_samples=2, # Small n for test
-            max_length=10
-        )
+# Token tensors shared by every stub call instead of rebuilt per call
+_IDS = torch.tensor([[1, 2, 3]], dtype=torch.long)
+_MASK = torch.ones((1, 3), dtype=torch.long)
+_GEN_OUT = torch.tensor([[101, 102]], dtype=torch.long)
 
-    def test_initialization(self):
-        self.assertEqual(self.signal.name, "human_ood")
 
-    @patch("transformers.AutoModelForCausalLM")
-    @patch("transformers.AutoTokenizer")
-    def test_run_mocked(self, mock_tokenizer, mock_causal):
-        # Mock model and tokenizer
-        mock_model = MagicMock()
-        mock_model.to.return_value = mock_model
+class _StubBatch(dict):
+    """Minimal BatchEncoding: a dict with attribute access and ``to``."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def to(self, device):
+        return self
+
+
+class _StubTokenizer:
+    pad_token = None
+    eos_token = "eos"
+    eos_token_id = 0
+
+    def __call__(self, text, **kwargs):
+        return _StubBatch(input_ids=_IDS, attention_mask=_MASK)
 
-        # Hidden states mocking
-        # Shape: (1, seq_len, dim=10)
-        # We need `outputs.hidden_states[-1]`
-        mock_output = MagicMock()
-        # Mock hidden states as tuple (one tensor)
-        # Return random embedding for input and generations
+    def encode(self, text):
+        return [1, 2, 3, 4, 5, 6]
 
-        # We need dynamic return values because we call it for input and N samples
-        def model_forward(*args, **kwargs):
-            mock_out = MagicMock()
-            # Random embedding (1, 3, 4) to match attention mask seq len
-            mock_out.hidden_states = (None, None, torch.randn(1, 3, 4))
-            return mock_out
+    def decode(self, ids, **kwargs):
+        return "generated text"
 
-        mock_model.side_effect = model_forward
 
-        # Generation mock
-        mock_model.generate.return_value = torch.tensor([[101, 102]])
+# (1, 3, 4) last hidden states matching the attention mask length, allocated
+# once; the input and each generated sample get a different one
+_HIDDEN_STATES = tuple(torch.randn(1, 3, 4) for _ in range(4))
 
-        mock_causal.from_pretrained.return_value = mock_model
 
-        mock_tok = MagicMock()
-        mock_tok.pad_token = None
-        mock_tok.eos_token = "eos"
+class _StubCausalLM:
+    def __init__(self):
+        self._hidden = itertools.cycle(_HIDDEN_STATES)
 
-        # Encode return
-        mock_tok.encode.return_value = [1, 2, 3, 4, 5, 6]
+    def to(self, device):
+        return self
 
-        # Call return (for embedding)
-        mock_tok_out = MagicMock()
-        mock_tok_out.input_ids = torch.tensor([[1, 2, 3]])
-        mock_tok_out.attention_mask = torch.tensor([[1, 1, 1]])
-        # Fix: .to() support
-        mock_tok_out.to.return_value = mock_tok_out
+    def eval(self):
+        return self
 
-        mock_tok.side_effect = lambda x, **kwargs: mock_tok_out
-        mock_tok.decode.return_value = "generated text"
+    def __call__(self, **kwargs):
+        return SimpleNamespace(hidden_states=(None, None, next(self._hidden)))
 
-        mock_tokenizer.from_pretrained.return_value = mock_tok
+    def generate(self, input_ids, **kwargs):
+        return _GEN_OUT
+
+
+class TestHumanOOD(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Construction is lazy (no model loading), so one instance serves every test
+        cls.signal = HumanOODSignal(
+            model_name="gpt2",
+            n_samples=2, # Small n for test
+            max_length=10
+        )
+
+    def test_initialization(self):
+        self.assertEqual(self.signal.name, "human_ood")
+
+    @patch("transformers.AutoModelForCausalLM")
+    @patch("transformers.AutoTokenizer")
+    def test_run_mocked(self, mock_tokenizer, mock_causal):
+        # Only from_pretrained is a MagicMock; the returned model and tokenizer
+        # are plain stubs producing real tensors
+        mock_causal.from_pretrained.return_value = _StubCausalLM()
+        mock_tokenizer.from_pretrained.return_value = _StubTokenizer()
 
         result = self.signal.run("This is a test input.")
 
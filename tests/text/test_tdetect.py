@@ -4,9 +4,13 @@ import unittest
 from unittest.mock import MagicMock, patch
 from veridex.text.tdetect import TDetectSignal
 
+_GEN_OUT = torch.tensor([[1, 2, 3]], dtype=torch.long)
+
 class TestTDetect(unittest.TestCase):
-    def setUp(self):
-        self.signal = TDetectSignal(
+    @classmethod
+    def setUpClass(cls):
+        # Construction is lazy (no model loading), so one instance serves every test
+        cls.signal = TDetectSignal(
             base_model_name="gpt2",
             perturbation_model_name="google/flan-t5-small",
             n_perturbations=5
@@ -30,7 +34,7 @@ class TestTDetect(unittest.TestCase):
         # Mock perturbation model
         mock_perturb_model = MagicMock()
         mock_perturb_model.to.return_value = mock_perturb_model # Handle .to(device)
-        mock_perturb_model.generate.return_value = torch.tensor([[1, 2, 3]])
+        mock_perturb_model.generate.return_value = _GEN_OUT
         mock_seq2seq.from_pretrained.return_value = mock_perturb_model
 
         # Mock tokenizer
@@ -39,7 +43,7 @@ class TestTDetect(unittest.TestCase):
         mock_ids.to.return_value = mock_ids # chainable .to()
         mock_tok_output = MagicMock()
         mock_tok_output.input_ids = mock_ids
-        mock_tok.side_effect = lambda x, return_tensors=None: mock_tok_output
+        mock_tok.return_value = mock_tok_output
         mock_tok.decode.return_value = "perturbed"
         mock_tokenizer.from_pretrained.return_value = mock_tok
 
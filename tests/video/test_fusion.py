@@ -0,0 +1,61 @@
+import unittest
+import pytest
+
+torch = pytest.importorskip("torch")
+import torch.nn as nn
+
+from veridex.video.models.compilation import inference_dtype
+from veridex.video.models.fusion import fuse_conv_bn
+from veridex.video.models.physnet import PhysNet
+from veridex.video.models.syncnet import SyncNet
+
+
+def _randomize_bn_stats(model):
+    # Fresh BatchNorm layers are identities in eval mode; give them real stats
+    gen = torch.Generator().manual_seed(0)
+    for m in model.modules():
+        if isinstance(m, (nn.BatchNorm2d, nn.BatchNorm3d)):
+            m.running_mean.copy_(torch.randn(m.num_features, generator=gen))
+            m.running_var.copy_(torch.rand(m.num_features, generator=gen) + 0.5)
+
+
+class TestFuseConvBN(unittest.TestCase):
+
+    def test_syncnet_outputs_unchanged(self):
+        model = SyncNet().eval()
+        _randomize_bn_stats(model)
+        audio = torch.randn(2, 1, 13, 20)
+        video = torch.randn(2, 15, 112, 112)
+
+        with torch.no_grad():
+            expected = model(audio, video)
+            fuse_conv_bn(model)
+            actual = model(audio, video)
+
+        self.assertFalse(any(isinstance(m, nn.BatchNorm2d) for m in model.modules()))
+        for e, a in zip(expected, actual):
+            torch.testing.assert_close(a, e, rtol=1e-4, atol=1e-5)
+
+    def test_physnet_outputs_unchanged(self):
+        model = PhysNet().eval()
+        _randomize_bn_stats(model)
+        clip = torch.randn(1, 3, 8, 32, 32)
+
+        with torch.no_grad():
+            expected = model(clip)
+            fuse_conv_bn(model)
+            actual = model(clip)
+
+        self.assertFalse(any(isinstance(m, nn.BatchNorm3d) for m in model.modules()))
+        torch.testing.assert_close(actual, expected, rtol=1e-4, atol=1e-5)
+
+
+class TestInferenceDtype(unittest.TestCase):
+
+    def test_float32_unless_bf16_allowed(self):
+        self.assertIs(inference_dtype(), torch.float32)
+        self.assertIn(inference_dtype(allow_bf16=True), (torch.float32, torch.bfloat16))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from veridex.video.lipsync import LipSyncSignal
+from tests._rng import RNG
+
+
+class TestLipSyncMFCC(unittest.TestCase):
+
+    def test_torchaudio_matches_librosa(self):
+        pytest.importorskip("librosa")
+        pytest.importorskip("torchaudio")
+
+        t = np.arange(3200) / 16000
+        chunks = [
+            (0.5 * np.sin(2 * np.pi * 220 * t) + 0.01 * RNG.standard_normal(3200)).astype(np.float32),
+            (0.05 * np.sin(2 * np.pi * 440 * t) + 0.001 * RNG.standard_normal(3200)).astype(np.float32),
+        ]
+
+        fast = LipSyncSignal()._compute_mfccs(chunks, 16000)
+        reference = LipSyncSignal()
+        reference._mfcc = False  # Force the librosa path
+        expected = reference._compute_mfccs(chunks, 16000)
+
+        self.assertEqual(fast.shape, (2, 13, 20))
+        np.testing.assert_allclose(fast, expected, rtol=1e-3, atol=0.5)
+
+
+class TestLipSyncSegments(unittest.TestCase):
+
+    def _load_segments(self, frame_count):
+        """Run _load_segments on a fake 25 fps video with 2s of audio; returns (segments, uniform mock)."""
+        cv2 = MagicMock()
+        cap = cv2.VideoCapture.return_value
+        cap.get.side_effect = lambda prop: {
+            cv2.CAP_PROP_FPS: 25.0, cv2.CAP_PROP_FRAME_COUNT: float(frame_count)
+        }.get(prop, 0.0)
+        cap.read.return_value = (True, np.zeros((64, 64, 3), dtype=np.uint8))
+        librosa = MagicMock()
+        librosa.load.return_value = (np.zeros(32000, dtype=np.float32), 16000)
+
+        signal = LipSyncSignal()
+        with patch.dict(sys.modules, {"cv2": cv2, "librosa": librosa}), \
+                patch("random.uniform", return_value=0.5) as uniform, \
+                patch.object(signal, "_get_detector"), \
+                patch.object(signal, "_crop_mouths", return_value=np.zeros((112, 112, 15), dtype=np.uint8)), \
+                patch.object(signal, "_compute_mfccs", side_effect=lambda chunks, sr: np.zeros((len(chunks), 13, 20))):
+            segments = signal._load_segments("dummy_video.mp4", n_segments=3)
+        return segments, uniform
+
+    def test_start_times_from_video_duration(self):
+        # 100 frames at 25 fps = 4s, although the audio is only 2s long
+        segments, uniform = self._load_segments(frame_count=100)
+        self.assertEqual(len(segments), 3)
+        uniform.assert_called_with(0, 4.0 - 0.3)
+
+    def test_audio_duration_fallback_without_frame_count(self):
+        segments, uniform = self._load_segments(frame_count=0)
+        self.assertEqual(len(segments), 3)
+        uniform.assert_called_with(0, 2.0 - 0.3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,35 +1,49 @@
+import sys
 import unittest
+import warnings
 from unittest.mock import MagicMock, patch
 import numpy as np
 from veridex.video.processing import FaceDetector
 
 class TestVideoProcessing(unittest.TestCase):
-    
+
+    @classmethod
+    def setUpClass(cls):
+        # One CascadeClassifier patch for the whole class instead of one per test
+        patcher = patch('cv2.CascadeClassifier')
+        cls.mock_cascade = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    # Availability of mediapipe is controlled through sys.modules: a module
+    # object makes `import mediapipe` succeed, None makes it raise ImportError.
+    # Patching builtins.__import__ instead would intercept every import.
+    @patch('veridex.video.processing.FaceDetector._init_mediapipe')
+    @patch('veridex.video.processing.FaceDetector._init_haar')
+    def test_init_auto_prefers_mediapipe(self, mock_init_haar, mock_init_mp):
+        with patch.dict(sys.modules, {'mediapipe': MagicMock()}):
+            detector = FaceDetector(backend='auto')
+        self.assertEqual(detector.backend, 'mediapipe')
+        mock_init_mp.assert_called_once()
+        mock_init_haar.assert_not_called()
+
     @patch('veridex.video.processing.FaceDetector._init_mediapipe')
     @patch('veridex.video.processing.FaceDetector._init_haar')
     def test_init_auto_fallback(self, mock_init_haar, mock_init_mp):
-        # Case 1: MediaPipe works
-        with patch('builtins.__import__') as mock_import:
-            # Setup import to succeed for mediapipe
-            # This is tricky because builtins.__import__ is called for EVERYTHING
-            # Easier to patch sys.modules or rely on the fact that patch('import mediapipe') isn't easy
-            # Let's rely on the method mocking in FaceDetector.__init__ logic.
-            # But the code does `import mediapipe as mp`.
-            pass
-
-        # Let's verify the logic by forcing exceptions
-        
-        # Test: Success path
-        # Assuming mediapipe is installed in test env (or mocked via conftest)
-        # If execution reaches _init_mediapipe, it calls it.
-        # Let's force valid execution if possible, or mock the import check.
-        
-        pass
+        # catch_warnings rather than assertWarns: assertWarns resets
+        # __warningregistry__ on every loaded module, which touches lazy
+        # modules (transformers) and can import the stubbed torchvision
+        with patch.dict(sys.modules, {'mediapipe': None}):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                detector = FaceDetector(backend='auto')
+        self.assertTrue(any(issubclass(w.category, UserWarning) for w in caught))
+        self.assertEqual(detector.backend, 'haar')
+        mock_init_haar.assert_called_once()
+        mock_init_mp.assert_not_called()
 
     def test_init_haar_explicit(self):
-        with patch('cv2.CascadeClassifier'):
-            detector = FaceDetector(backend='haar')
-            self.assertEqual(detector.backend, 'haar')
+        detector = FaceDetector(backend='haar')
+        self.assertEqual(detector.backend, 'haar')
     
     @patch('veridex.video.processing.FaceDetector._init_mediapipe')
     def test_init_mediapipe_explicit(self, mock_init):
@@ -37,31 +51,90 @@ class TestVideoProcessing(unittest.TestCase):
         self.assertEqual(detector.backend, 'mediapipe')
         mock_init.assert_called_once()
         
+    @patch('veridex.video.processing.FaceDetector._init_yunet')
+    def test_init_yunet_explicit(self, mock_init):
+        detector = FaceDetector(backend='yunet')
+        self.assertEqual(detector.backend, 'yunet')
+        mock_init.assert_called_once()
+
     def test_detect_faces_empty(self):
         # Mock detector to return empty list
-        with patch('cv2.CascadeClassifier'):
-            detector = FaceDetector(backend='haar')
-            detector.detector.detectMultiScale.return_value = []
-            
-            frame = np.zeros((100, 100, 3), dtype=np.uint8)
-            faces = detector.detect(frame)
-            self.assertEqual(len(faces), 0)
+        detector = FaceDetector(backend='haar')
+        detector.detector.detectMultiScale.return_value = []
+
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        faces = detector.detect(frame)
+        self.assertEqual(len(faces), 0)
+
+    def test_detect_roi_and_scale_map_back_to_frame(self):
+        detector = FaceDetector(backend='haar')
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        with patch.object(detector, '_detect_haar', return_value=[(5, 5, 10, 10)]) as mock_haar:
+            faces = detector.detect(frame, roi=(20, 30, 40, 40))
+        self.assertEqual(mock_haar.call_args[0][0].shape, (40, 40, 3))
+        self.assertEqual(faces, [(25, 35, 10, 10)])
+
+        small = np.zeros((20, 20, 3), dtype=np.uint8)
+        with patch.object(detector.cv2, 'resize', return_value=small), \
+                patch.object(detector, '_detect_haar', return_value=[(5, 5, 10, 10)]):
+            faces = detector.detect(frame, roi=(20, 30, 40, 40), scale=0.5)
+        self.assertEqual(faces, [(30, 40, 20, 20)])
+
+        # ROI entirely outside the frame
+        self.assertEqual(detector.detect(frame, roi=(200, 200, 10, 10)), [])
 
     def test_extract_face(self):
         # Test roi extraction
-        with patch('cv2.CascadeClassifier'):
-            detector = FaceDetector(backend='haar')
-            
-            frame = np.zeros((100, 100, 3), dtype=np.uint8)
-            # Fill region with 255
-            frame[10:60, 10:60] = 255
-            
-            bbox = (10, 10, 50, 50)
-            face = detector.extract_face(frame, bbox, size=(10, 10))
-            
-            self.assertEqual(face.shape, (10, 10, 3))
-            # Resized face should be approx 255 (allowing for interpolation artifacts)
-            self.assertTrue(np.mean(face) > 200)
+        detector = FaceDetector(backend='haar')
+
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        # Fill region with 255
+        frame[10:60, 10:60] = 255
+
+        bbox = (10, 10, 50, 50)
+        face = detector.extract_face(frame, bbox, size=(10, 10))
+
+        self.assertEqual(face.shape, (10, 10, 3))
+        # Resized face should be approx 255 (allowing for interpolation artifacts)
+        self.assertTrue(np.mean(face) > 200)
+
+        # Resizing into a caller-provided buffer
+        out = np.zeros((10, 10, 3), dtype=np.uint8)
+        self.assertIs(detector.extract_face(frame, bbox, size=(10, 10), out=out), out)
+        self.assertTrue(np.mean(out) > 200)
+
+    def test_track_faces_detect_every(self):
+        detector = FaceDetector(backend='haar')
+        frames = [np.zeros((100, 100, 3), dtype=np.uint8)] * 25
+
+        with patch.object(detector, 'detect', return_value=[(10, 10, 50, 50)]) as mock_detect:
+            rois = detector.track_faces(frames, size=(10, 10))
+        # Initial detection, then one per following frame
+        self.assertEqual(mock_detect.call_count, 25)
+        self.assertEqual(len(rois), 25)
+
+        with patch.object(detector, 'detect', return_value=[(10, 10, 50, 50)]) as mock_detect:
+            rois = detector.track_faces(frames, size=(10, 10), detect_every=10)
+        # Initial detection on frame 0, then frames 10 and 20
+        self.assertEqual(mock_detect.call_count, 3)
+        self.assertEqual(len(rois), 25)
+
+    def test_track_faces_reduce_rgb(self):
+        detector = FaceDetector(backend='haar')
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        frame[10:60, 10:60] = (30, 60, 90)
+
+        with patch.object(detector, 'detect', return_value=[(10, 10, 50, 50)]):
+            trace = detector.track_faces([frame] * 5, reduce_rgb=True)
+        self.assertEqual(trace.shape, (5, 3))
+        self.assertEqual(trace.dtype, np.float32)
+        np.testing.assert_allclose(trace, [[30, 60, 90]] * 5)
+
+        # No face anywhere: empty, not a zero-filled trace
+        with patch.object(detector, 'detect', return_value=[]):
+            trace = detector.track_faces([frame] * 5, reduce_rgb=True)
+        self.assertEqual(trace.size, 0)
 
 if __name__ == '__main__':
     unittest.main()
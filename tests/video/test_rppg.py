@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+scipy_signal = pytest.importorskip("scipy.signal")
+
+from veridex.video.rppg import RPPGSignal, _trapz_uniform, chrom_bvp, detrended_psd
+from tests._rng import RNG
+
+
+class TestChromBVP(unittest.TestCase):
+
+    def test_recovers_pulse_frequency(self):
+        fs, pulse_hz = 30.0, 1.2
+        t = np.arange(300) / fs
+        pulse = np.sin(2 * np.pi * pulse_hz * t)
+
+        # Skin tone with a small pulsatile component, strongest in green
+        base = np.array([0.6, 0.4, 0.3])
+        rgb = base * (1 + 0.01 * pulse[:, None] * np.array([0.3, 0.8, 0.5]))
+        rgb += 0.001 * RNG.standard_normal(rgb.shape)
+
+        bvp = chrom_bvp(rgb, fs=fs)
+        freqs, psd = scipy_signal.periodogram(bvp, fs)
+
+        self.assertEqual(bvp.shape, (300,))
+        self.assertAlmostEqual(freqs[np.argmax(psd)], pulse_hz, delta=0.1)
+
+    def test_zero_trace_is_rejected(self):
+        signal = RPPGSignal()
+        frames = np.zeros((60, 64, 64, 3), dtype=np.uint8)
+        with patch.object(signal, '_load_video_frames', return_value=frames), \
+                patch.object(signal, '_detect_faces', return_value=np.zeros((60, 3), dtype=np.float32)):
+            result = signal.run("dummy_video.mp4")
+
+        self.assertIsNotNone(result.error)
+        self.assertEqual(result.score, 0.5)
+        self.assertEqual(result.confidence, 0.0)
+
+
+class TestDetrendedPSD(unittest.TestCase):
+
+    def test_matches_scipy(self):
+        for n in (300, 301):
+            t = np.arange(n) / 30.0
+            x = np.sin(2 * np.pi * 1.5 * t) + 0.02 * np.arange(n) + RNG.standard_normal(n)
+
+            freqs, psd = detrended_psd(x, fs=30.0)
+            ref_freqs, ref_psd = scipy_signal.periodogram(scipy_signal.detrend(x), 30.0)
+
+            np.testing.assert_allclose(freqs, ref_freqs)
+            np.testing.assert_allclose(psd, ref_psd, rtol=1e-9, atol=1e-12)
+
+    def test_trapz_uniform_matches_trapezoid_rule(self):
+        y = RNG.random(50)
+        dx = 0.1
+        expected = sum((y[i] + y[i + 1]) / 2 * dx for i in range(len(y) - 1))
+        self.assertAlmostEqual(_trapz_uniform(y, dx), expected)
+        self.assertEqual(_trapz_uniform(y[:1], dx), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
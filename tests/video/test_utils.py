@@ -40,12 +40,12 @@ class TestVideoUtils(unittest.TestCase):
         # Random
         indices = smart_sample_frames(total, target, 'random')
         self.assertEqual(len(indices), 10)
-        self.assertEqual(len(set(indices)), 10) # Unique
+        self.assertEqual(np.unique(indices).size, 10) # Unique
         
         # Target > Total
         indices = smart_sample_frames(10, 20)
         self.assertEqual(len(indices), 10)
-        self.assertEqual(indices, list(range(10)))
+        np.testing.assert_array_equal(indices, np.arange(10))
         
         # Invalid strategy
         with self.assertRaises(ValueError):
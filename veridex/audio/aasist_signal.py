@@ -159,7 +159,11 @@ class AASISTSignal(BaseSignal):
         Extract spectro-temporal features inspired by AASIST.
         """
         import scipy.stats as stats
-        from scipy.signal import stft
+        from veridex.audio.utils import compute_stft
+        
+        # Work in float32 end to end (load_audio already yields float32)
+        mel_spec = np.ascontiguousarray(mel_spec, dtype=np.float32)
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
         
         # 1. Temporal modulation features
         # Measure variation in each frequency band over time
@@ -174,7 +178,7 @@ class AASISTSignal(BaseSignal):
         
         # 3. Phase coherence
         # AI vocoders often have unnatural phase relationships
-        f, t, Zxx = stft(audio, fs=sr, nperseg=self.n_fft, noverlap=self.n_fft - self.hop_length)
+        Zxx = compute_stft(audio, n_fft=self.n_fft, hop_length=self.hop_length)
         phase = np.angle(Zxx)
         
         # Phase derivative (instantaneous frequency deviation)
@@ -192,15 +196,16 @@ class AASISTSignal(BaseSignal):
         # Natural speech has specific correlations, AI differs
         # Sample a few bands to reduce computation
         bands = [0, mel_spec.shape[0]//4, mel_spec.shape[0]//2, 3*mel_spec.shape[0]//4, -1]
-        correlations = []
-        for i in range(len(bands) - 1):
-            band1 = mel_spec[bands[i], :]
-            band2 = mel_spec[bands[i+1], :]
-            corr = np.corrcoef(band1, band2)[0, 1]
-            if not np.isnan(corr):
-                correlations.append(abs(corr))
+        # Pearson correlation of adjacent sampled bands, computed explicitly
+        # because np.corrcoef upcasts to float64
+        centered = mel_spec[bands, :] - mel_spec[bands, :].mean(axis=1, keepdims=True)
+        norms = np.sqrt(np.sum(centered**2, axis=1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corrs = np.sum(centered[:-1] * centered[1:], axis=1) / (norms[:-1] * norms[1:])
+        # Constant bands give NaN (zero variance), as with np.corrcoef
+        correlations = np.abs(np.clip(corrs[~np.isnan(corrs)], -1.0, 1.0))
         
-        mean_band_correlation = float(np.mean(correlations)) if correlations else 0.0
+        mean_band_correlation = float(np.mean(correlations)) if correlations.size else 0.0
         
         # 6. Spectral flux (measure of spectral change)
         spectral_flux = np.sqrt(np.sum(np.diff(mel_spec, axis=1)**2, axis=0))
@@ -175,6 +175,46 @@ def compute_spectrogram(
     return magnitude
 
 
+def compute_stft(
+    audio: np.ndarray,
+    n_fft: int = 512,
+    hop_length: int = 256,
+) -> np.ndarray:
+    """
+    Compute a one-sided complex STFT with a single batched real FFT.
+    
+    Framing matches ``scipy.signal.stft`` defaults (periodic Hann window,
+    ``n_fft // 2`` zeros of padding on each side, tail zero-padded to a whole
+    number of hops), but all frames are strided views transformed by one
+    ``scipy.fft.rfft`` call instead of going through the generic spectral helper.
+    
+    Args:
+        audio: Audio signal
+        n_fft: FFT window size
+        hop_length: Hop length between frames
+        
+    Returns:
+        Complex STFT (n_fft // 2 + 1 x frames)
+    """
+    from scipy.fft import rfft
+    from scipy.signal import get_window
+    
+    audio = np.asarray(audio)
+    half = n_fft // 2
+    padded_len = len(audio) + 2 * half
+    tail = (-(padded_len - n_fft) % hop_length) % n_fft
+    padded = np.pad(audio, (half, half + tail))
+    
+    # (frames, n_fft) strided view, no copy until windowing
+    frames = np.lib.stride_tricks.sliding_window_view(padded, n_fft)[::hop_length]
+    # Keep float32 input in float32 (complex64 output), like scipy.signal.stft
+    window = get_window("hann", n_fft).astype(np.result_type(padded.dtype, np.float32))
+    
+    stft = rfft(frames * (window / window.sum()), axis=-1, workers=-1)
+    
+    return stft.T
+
+
 def validate_audio(
     audio: np.ndarray,
     sr: int,
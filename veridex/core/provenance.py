@@ -1,6 +1,16 @@
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
 from veridex.core.signal import BaseSignal, DetectionResult
 
+
+def _not_a_path() -> DetectionResult:
+    return DetectionResult(score=0.0, confidence=0.0, metadata={}, error="Input must be a file path string.")
+
+
+def _not_installed() -> DetectionResult:
+    return DetectionResult(score=0.0, confidence=0.0, metadata={}, error="c2pa-python not installed.")
+
+
 class C2PASignal(BaseSignal):
     """
     Detects Content Credentials (C2PA) manifests in files.
@@ -17,7 +27,8 @@ class C2PASignal(BaseSignal):
     """
 
     def __init__(self):
-        pass
+        # c2pa module, imported by the first successful dependency check
+        self._c2pa = None
 
     @property
     def name(self) -> str:
@@ -35,69 +46,104 @@ class C2PASignal(BaseSignal):
                 "The 'c2pa' library is required for C2PASignal. "
                 "Install it with `pip install c2pa-python`."
             )
+        self._c2pa = c2pa
+
+    def _ensure_c2pa(self) -> Any:
+        """Return the c2pa module, importing it on first use only."""
+        if self._c2pa is None:
+            self.check_dependencies()
+        return self._c2pa
 
     def run(self, input_data: Any) -> DetectionResult:
         """
         Input data should be a file path (str).
         """
         if not isinstance(input_data, str):
-            return DetectionResult(score=0.0, confidence=0.0, metadata={}, error="Input must be a file path string.")
+            return _not_a_path()
 
         try:
-            self.check_dependencies()
-            import c2pa
+            c2pa = self._ensure_c2pa()
+        except ImportError:
+            return _not_installed()
 
-            # This is a stub implementation based on c2pa-python usage
-            # Assuming c2pa.read_manifest or similar API
-
-            try:
-                manifest_store = c2pa.read_json(input_data)
-
-                if not manifest_store:
-                     return DetectionResult(
-                        score=0.0,
-                        confidence=1.0,
-                        metadata={"status": "no_manifest"},
-                        error=None
-                    )
-
-                # Check for AI assertions in the manifest
-                # This logic would need to be refined based on actual C2PA assertion schemas
-                # For now, if a valid manifest exists, we flag it.
-
-                is_ai_signed = False
-                assertions = []
-
-                # Iterate through manifest to find 'c2pa.actions'
-                # (Pseudocode as strict schema parsing depends on the library version)
-                if "assertions" in str(manifest_store).lower(): # diverse check
-                     assertions.append("Found C2PA Assertions")
-
-                # If we find explicit AI generation action:
-                # is_ai_signed = True
-
-                return DetectionResult(
-                    score=1.0 if is_ai_signed else 0.0, # 1.0 if explicitly signed as AI
-                    confidence=1.0, # Cryptographic certainty
-                    metadata={
-                        "manifest_found": True,
-                        "raw_manifest": str(manifest_store)[:500] # Truncate for safety
-                    }
-                )
+        return self._read_manifest(c2pa, input_data)
+
+    def run_batch(self, paths: List[Any], max_workers: Optional[int] = None) -> List[DetectionResult]:
+        """
+        Scan many files with a single dependency check.
 
-            except Exception as e:
-                # Likely no manifest or file error
-                return DetectionResult(
+        Manifest parsing and signature checks run inside the native c2pa
+        extension, so a thread pool can overlap them across files.
+
+        Args:
+            paths: File paths to scan.
+            max_workers: Number of threads to scan with. ``None`` scans serially.
+
+        Returns:
+            One DetectionResult per path, in the same order.
+        """
+        try:
+            c2pa = self._ensure_c2pa()
+        except ImportError:
+            return [_not_a_path() if not isinstance(p, str) else _not_installed() for p in paths]
+
+        def scan(p: Any) -> DetectionResult:
+            return self._read_manifest(c2pa, p) if isinstance(p, str) else _not_a_path()
+
+        if max_workers is None or max_workers <= 1 or len(paths) <= 1:
+            return [scan(p) for p in paths]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(scan, paths))
+
+    def _read_manifest(self, c2pa: Any, input_data: str) -> DetectionResult:
+        # This is a stub implementation based on c2pa-python usage
+        # Assuming c2pa.read_manifest or similar API
+
+        try:
+            manifest_store = c2pa.read_json(input_data)
+
+            if not manifest_store:
+                 return DetectionResult(
                     score=0.0,
-                    confidence=0.0,
-                    metadata={"status": "read_error"},
-                    error=f"C2PA read error: {e}"
+                    confidence=1.0,
+                    metadata={"status": "no_manifest"},
+                    error=None
                 )
 
-        except ImportError:
-             return DetectionResult(
+            # Check for AI assertions in the manifest
+            # This logic would need to be refined based on actual C2PA assertion schemas
+            # For now, if a valid manifest exists, we flag it.
+
+            is_ai_signed = False
+            assertions = []
+
+            # read_json already returns the manifest as JSON text; stringify
+            # once and reuse it for the check and the metadata excerpt
+            manifest_text = manifest_store if isinstance(manifest_store, str) else str(manifest_store)
+
+            # Iterate through manifest to find 'c2pa.actions'
+            # (Pseudocode as strict schema parsing depends on the library version)
+            if "assertions" in manifest_text.lower(): # diverse check
+                 assertions.append("Found C2PA Assertions")
+
+            # If we find explicit AI generation action:
+            # is_ai_signed = True
+
+            return DetectionResult(
+                score=1.0 if is_ai_signed else 0.0, # 1.0 if explicitly signed as AI
+                confidence=1.0, # Cryptographic certainty
+                metadata={
+                    "manifest_found": True,
+                    "raw_manifest": manifest_text[:500] # Truncate for safety
+                }
+            )
+
+        except Exception as e:
+            # Likely no manifest or file error
+            return DetectionResult(
                 score=0.0,
                 confidence=0.0,
-                metadata={},
-                error="c2pa-python not installed."
+                metadata={"status": "read_error"},
+                error=f"C2PA read error: {e}"
             )
@@ -1,17 +1,21 @@
 import numpy as np
 from typing import Dict, List, Union
 
-def calculate_auc(y_true: List[int], y_scores: List[float]) -> float:
+def calculate_auc(y_true: Union[List[int], np.ndarray], y_scores: Union[List[float], np.ndarray]) -> float:
     """
     Calculates Area Under the ROC Curve (AUROC) manually.
+
+    Accepts lists or numpy arrays; arrays are used without copying.
     """
-    if len(set(y_true)) < 2:
+    y_true = np.asarray(y_true)
+    y_scores = np.asarray(y_scores)
+    if np.unique(y_true).size < 2:
         return 0.5  # Undefined if only one class is present
 
     # Combine and sort by score descending
     desc_score_indices = np.argsort(y_scores)[::-1]
-    y_score_sorted = np.array(y_scores)[desc_score_indices]
-    y_true_sorted = np.array(y_true)[desc_score_indices]
+    y_score_sorted = y_scores[desc_score_indices]
+    y_true_sorted = y_true[desc_score_indices]
 
     # Calculate TPR and FPR
     distinct_value_indices = np.where(np.diff(y_score_sorted))[0]
@@ -49,21 +53,22 @@ def calculate_metrics(y_true: List[int], y_pred_scores: List[float], threshold:
     Returns:
         Dictionary containing accuracy, precision, recall, f1, and auroc.
     """
-    y_true = np.array(y_true)
-    y_scores = np.array(y_pred_scores)
-    y_pred = (y_scores >= threshold).astype(int)
+    y_true = np.asarray(y_true)
+    y_scores = np.asarray(y_pred_scores, dtype=float)
+    pred_pos = y_scores >= threshold
+    true_pos = y_true == 1
 
-    tp = np.sum((y_pred == 1) & (y_true == 1))
-    tn = np.sum((y_pred == 0) & (y_true == 0))
-    fp = np.sum((y_pred == 1) & (y_true == 0))
-    fn = np.sum((y_pred == 0) & (y_true == 1))
+    tp = np.count_nonzero(pred_pos & true_pos)
+    fp = np.count_nonzero(pred_pos) - tp
+    fn = np.count_nonzero(true_pos) - tp
+    tn = np.count_nonzero(~pred_pos & (y_true == 0))
 
     accuracy = (tp + tn) / len(y_true) if len(y_true) > 0 else 0.0
     precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
     recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
     f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
 
-    auroc = calculate_auc(y_true.tolist(), y_scores.tolist())
+    auroc = calculate_auc(y_true, y_scores)
 
     return {
         "accuracy": float(accuracy),
@@ -17,6 +17,9 @@ class Evaluator:
         """
         Runs the signal on the dataset and computes metrics.
 
+        Signals that define ``run_batch(inputs) -> List[DetectionResult]`` are
+        called once with every sample instead of once per sample.
+
         Args:
             signal: The detection signal to evaluate.
             dataset: The dataset containing samples.
@@ -38,9 +41,20 @@ class Evaluator:
 
         start_time = time.time()
 
-        for sample in tqdm(dataset, desc=f"Evaluating {signal.name}"):
+        batch_results = None
+        if hasattr(signal, "run_batch"):
+            # One call for the whole dataset lets signals vectorize their work;
+            # if it fails, fall back to per-sample runs so errors are attributed
+            try:
+                batch_results = list(signal.run_batch([sample.data for sample in dataset]))
+            except Exception:
+                batch_results = None
+            if batch_results is not None and len(batch_results) != len(dataset):
+                batch_results = None
+
+        for i, sample in enumerate(tqdm(dataset, desc=f"Evaluating {signal.name}")):
             try:
-                result = signal.run(sample.data)
+                result = batch_results[i] if batch_results is not None else signal.run(sample.data)
 
                 if result.error:
                     errors += 1
@@ -27,16 +27,24 @@ class DIRESignal(BaseSignal):
         model_id (str): HuggingFace Diffusion model ID.
     """
 
-    def __init__(self, model_id: str = "runwayml/stable-diffusion-v1-5", device: str = "cpu"):
+    def __init__(
+        self,
+        model_id: str = "runwayml/stable-diffusion-v1-5",
+        device: str = "cpu",
+        image_size: int = 512,
+    ):
         """
         Initialize the DIRE signal.
 
         Args:
             model_id (str): The Stable Diffusion model to use for reconstruction.
             device (str): Computation device ('cpu' or 'cuda').
+            image_size (int): Side length inputs are resized to before reconstruction.
+                Defaults to 512, the native resolution of Stable Diffusion v1.
         """
         self.model_id = model_id
         self.device = device
+        self.image_size = image_size
         self._pipeline = None
 
     @property
@@ -115,7 +123,7 @@ class DIRESignal(BaseSignal):
 
         # Resize for SD (usually 512x512)
         original_size = image.size
-        image_resized = image.resize((512, 512), Image.BICUBIC)
+        image_resized = image.resize((self.image_size, self.image_size), Image.BICUBIC)
 
         # 2. Run Reconstruction
         try:
@@ -0,0 +1,93 @@
+"""
+Process-wide cache of HuggingFace causal LMs shared by the text signals.
+
+PerplexitySignal and DetectGPTSignal often use the same model (e.g. "gpt2").
+Loading through this cache keeps one copy of the weights per
+(model, device, dtype) instead of one per signal instance.
+"""
+
+import functools
+from importlib.util import find_spec
+from typing import Any, Tuple
+
+
+def default_dtype(device: str) -> str:
+    """Half precision on CUDA (bfloat16 where supported), float32 elsewhere."""
+    import torch
+
+    if device == "cuda":
+        return "bfloat16" if torch.cuda.is_bf16_supported() else "float16"
+    return "float32"
+
+
+@functools.lru_cache(maxsize=4)
+def load_causal_lm(
+    model_id: str, device: str, dtype_str: str, load_in_8bit: bool = False
+) -> Tuple[Any, Any]:
+    """
+    Load (or reuse) a tokenizer and eval-mode causal LM.
+
+    The tokenizer is right-padded, with EOS as its pad token when it has none,
+    so batched inputs line up with shifted labels. On CUDA the model is
+    compiled (and warmed up on a small padded batch, keeping the eager model
+    if that fails) and TF32/cuDNN autotuning are enabled.
+
+    Args:
+        model_id: HuggingFace model ID.
+        device: Device to place the model on ('cpu', 'cuda').
+        dtype_str: Name of the torch dtype to load weights in, e.g. "float32".
+        load_in_8bit: Quantize weights to int8 with bitsandbytes. Only honoured
+            on CUDA with bitsandbytes installed; otherwise the model loads
+            unquantized.
+
+    Returns:
+        Tuple of (tokenizer, model).
+    """
+    import torch
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    tokenizer.padding_side = "right"
+
+    if device == "cuda":
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+
+    if load_in_8bit and device == "cuda" and find_spec("bitsandbytes") is not None:
+        from transformers import BitsAndBytesConfig
+
+        model = AutoModelForCausalLM.from_pretrained(
+            model_id,
+            quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+            device_map={"": device},
+        )
+        model.eval()
+        # Int8 kernels are not torch.compile friendly; stay eager
+        return tokenizer, model
+
+    model = AutoModelForCausalLM.from_pretrained(
+        model_id, torch_dtype=getattr(torch, dtype_str)
+    ).to(device)
+    model.eval()
+
+    if device == "cuda":
+        try:
+            compiled = torch.compile(model, mode="reduce-overhead", dynamic=True)
+            # Compilation is lazy: only a forward surfaces Inductor/Triton
+            # errors, and a broken model would otherwise stay in this cache
+            warmup = tokenizer(
+                ["warm up", "a"], return_tensors="pt", padding=True, pad_to_multiple_of=64
+            ).to(device)
+            with torch.inference_mode():
+                compiled(**warmup, use_cache=False)
+        except Exception:
+            pass  # Fall back to eager
+        else:
+            model = compiled
+            from veridex.utils.compile_cache import load_compile_cache
+            load_compile_cache(model_id)
+
+    return tokenizer, model
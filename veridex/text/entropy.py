@@ -1,7 +1,36 @@
+import hashlib
 import zlib
-from typing import Any
+from typing import Any, Dict
 from veridex.core.signal import BaseSignal, DetectionResult
 
+# Compressed lengths keyed by content digest, so repeated documents are
+# compressed once without keeping their text alive
+_CACHE_SIZE = 512
+
+# Input slice size for streaming compression
+_CHUNK_SIZE = 1 << 16
+_compressed_len_cache: Dict[bytes, int] = {}
+
+
+def _compressed_len(encoded: bytes) -> int:
+    key = hashlib.blake2b(encoded, digest_size=16).digest()
+    length = _compressed_len_cache.get(key)
+    if length is None:
+        # Stream through compressobj and count bytes instead of holding the
+        # whole compressed buffer; the length matches zlib.compress exactly
+        compressor = zlib.compressobj()
+        view = memoryview(encoded)
+        length = 0
+        for start in range(0, len(view), _CHUNK_SIZE):
+            length += len(compressor.compress(view[start:start + _CHUNK_SIZE]))
+        length += len(compressor.flush())
+        if len(_compressed_len_cache) >= _CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _compressed_len_cache[next(iter(_compressed_len_cache))]
+        _compressed_len_cache[key] = length
+    return length
+
+
 class ZlibEntropySignal(BaseSignal):
     """
     Detects AI content using compression ratio (zlib entropy).
@@ -45,8 +74,8 @@ class ZlibEntropySignal(BaseSignal):
             )
 
         encoded = input_data.encode("utf-8")
-        compressed = zlib.compress(encoded)
-        ratio = len(compressed) / len(encoded)
+        compressed_len = _compressed_len(encoded)
+        ratio = compressed_len / len(encoded)
         
         # Calculate confidence based on how extreme the ratio is
         # Very compressible (low ratio) or very incompressible (high ratio) = higher confidence
@@ -75,7 +104,7 @@ class ZlibEntropySignal(BaseSignal):
             confidence=confidence,
             metadata={
                 "original_len": len(encoded),
-                "compressed_len": len(compressed),
+                "compressed_len": compressed_len,
                 "compression_ratio": ratio
             }
         )
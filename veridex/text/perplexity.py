@@ -1,8 +1,31 @@
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
+import hashlib
 import math
-import numpy as np
+import re
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
 from veridex.core.signal import BaseSignal, DetectionResult
 
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Compiled models pad inputs up to a multiple of this to limit recompiles
+_PAD_BUCKET = 64
+
+# Tokenized inputs kept per signal instance, keyed by text digest
+_ENCODING_CACHE_SIZE = 128
+
+# Long texts are scored in windows of the model context (1024 for GPT-2),
+# advancing by _STRIDE tokens so every token after the first window keeps
+# at least _MAX_LENGTH - _STRIDE tokens of context
+_MAX_LENGTH = 1024
+_STRIDE = 512
+_WINDOWS_PER_BATCH = 8
+
 class PerplexitySignal(BaseSignal):
     """
     Analyzes text complexity using Perplexity metrics.
@@ -20,20 +43,25 @@ class PerplexitySignal(BaseSignal):
     Attributes:
         model_name (str): Name of the underlying model (default: "gpt2").
         device (Optional[str]): Device to run model on ('cpu', 'cuda').
+        load_in_8bit (bool): Whether to quantize the model to int8 on CUDA.
     """
 
-    def __init__(self, model_name: str = "gpt2", device: Optional[str] = None):
+    def __init__(self, model_name: str = "gpt2", device: Optional[str] = None, load_in_8bit: bool = False):
         """
         Initialize the Perplexity signal.
 
         Args:
             model_name (str): Identifier for the model used to calculate perplexity.
             device (Optional[str]): Device to run model on.
+            load_in_8bit (bool): Quantize the model to int8 with bitsandbytes to cut
+                GPU memory. Requires CUDA and `bitsandbytes`; ignored otherwise.
         """
         self.model_name = model_name
         self._device = device
+        self.load_in_8bit = load_in_8bit
         self._model = None
         self._tokenizer = None
+        self._encodings: Dict[bytes, Any] = {}
 
     @property
     def name(self) -> str:
@@ -55,20 +83,78 @@ class PerplexitySignal(BaseSignal):
                 "Install with `pip install veridex[text]`"
             )
 
+    @staticmethod
+    def _split_sentences(text: str) -> List[str]:
+        """Split text into sentences on whitespace after '.', '!' or '?'."""
+        return [s for s in _SENTENCE_SPLIT_RE.split(text.strip()) if s]
+
+    def _encode(self, text: str) -> Any:
+        """Tokenize text, reusing the encoding for texts seen recently."""
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        inputs = self._encodings.get(key)
+        if inputs is None:
+            # No truncation: text beyond the model context is windowed in run()
+            inputs = self._tokenizer(text, return_tensors="pt")
+            if len(self._encodings) >= _ENCODING_CACHE_SIZE:
+                del self._encodings[next(iter(self._encodings))]
+            self._encodings[key] = inputs
+        return inputs
+
+    def _windows(self, input_ids: Any) -> List[Any]:
+        """
+        Split a (1, L) token tensor into batches of overlapping windows.
+
+        Each window holds at most `_MAX_LENGTH` tokens. Labels are -100 for
+        padding and for context tokens already scored by an earlier window,
+        so every token is predicted exactly once.
+
+        Returns:
+            List of (inputs, labels) pairs, each holding up to
+            `_WINDOWS_PER_BATCH` windows.
+        """
+        ids = input_ids[0]
+        length = ids.shape[0]
+
+        spans = []  # (begin, end, number of new target tokens)
+        prev_end = 0
+        for begin in range(0, length, _STRIDE):
+            end = min(begin + _MAX_LENGTH, length)
+            spans.append((begin, end, end - prev_end))
+            prev_end = end
+            if end == length:
+                break
+
+        width = max(end - begin for begin, end, _ in spans)
+        if self._device == "cuda":
+            width = -(-width // _PAD_BUCKET) * _PAD_BUCKET
+
+        batches = []
+        for i in range(0, len(spans), _WINDOWS_PER_BATCH):
+            group = spans[i:i + _WINDOWS_PER_BATCH]
+            batch_ids = torch.full((len(group), width), self._tokenizer.pad_token_id, dtype=ids.dtype)
+            mask = torch.zeros((len(group), width), dtype=torch.long)
+            labels = torch.full((len(group), width), -100, dtype=ids.dtype)
+            for row, (begin, end, n_new) in enumerate(group):
+                n_tokens = end - begin
+                batch_ids[row, :n_tokens] = ids[begin:end]
+                mask[row, :n_tokens] = 1
+                labels[row, n_tokens - n_new:n_tokens] = ids[end - n_new:end]
+            batches.append(({"input_ids": batch_ids, "attention_mask": mask}, labels))
+        return batches
+
     def _load_model(self):
         if self._model is not None:
             return
 
         self.check_dependencies()
-        import torch
-        from transformers import AutoModelForCausalLM, AutoTokenizer
+        from veridex.text._model_cache import default_dtype, load_causal_lm
 
         if self._device is None:
             self._device = "cuda" if torch.cuda.is_available() else "cpu"
 
-        self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        self._model = AutoModelForCausalLM.from_pretrained(self.model_name).to(self._device)
-        self._model.eval()
+        self._tokenizer, self._model = load_causal_lm(
+            self.model_name, self._device, default_dtype(self._device), self.load_in_8bit
+        )
 
     def run(self, input_data: Any) -> DetectionResult:
         """
@@ -87,33 +173,43 @@ class PerplexitySignal(BaseSignal):
 
         try:
             self._load_model()
-            import torch
 
-            # Tokenize with truncation to max length (usually 1024 for GPT-2)
-            # This prevents crashes on long text.
-            inputs = self._tokenizer(
-                input_data,
-                return_tensors="pt",
-                truncation=True,
-                max_length=1024
-            )
+            inputs = self._encode(input_data)
 
             if inputs["input_ids"].shape[1] < 2:
                  # Too short for meaningful perplexity
                  return DetectionResult(score=0.5, confidence=0.0, metadata={"reason": "Text too short"})
 
-            inputs = {k: v.to(self._device) for k, v in inputs.items()}
-
-            with torch.no_grad():
-                outputs = self._model(**inputs, labels=inputs["input_ids"])
-                loss = outputs.loss
+            if inputs["input_ids"].shape[1] <= _MAX_LENGTH and self._device != "cuda":
+                # Fits in one unpadded forward
+                batches = [(inputs, inputs["input_ids"])]
+            else:
+                batches = self._windows(inputs["input_ids"])
+
+            with torch.inference_mode():
+                total_nll, total_tokens = 0.0, 0
+                for batch, labels in batches:
+                    batch = {k: v.to(self._device) for k, v in batch.items()}
+                    labels = labels.to(self._device)
+                    # Upcast before exp so half-precision loss does not overflow
+                    loss = self._model(**batch, labels=labels, use_cache=False).loss.float()
+                    if len(batches) == 1:
+                        break
+                    # HF averages over the batch's scored tokens; re-weight
+                    # so the document mean counts every token equally
+                    n_scored = int((labels[:, 1:] != -100).sum())
+                    total_nll = total_nll + loss * n_scored
+                    total_tokens += n_scored
+                if len(batches) > 1:
+                    loss = total_nll / total_tokens
                 perplexity = torch.exp(loss).item()
 
             # Heuristic mapping from Perplexity to AI Score
             # Threshold = 50. If PPL < 50, P(AI) > 0.5.
             threshold = 50.0
             scale = 10.0
-            score = 1.0 / (1.0 + np.exp((perplexity - threshold) / scale))
+            # Logistic in tanh form: scalar math, and no overflow for huge PPL
+            score = 0.5 * (1.0 - math.tanh((perplexity - threshold) / (2.0 * scale)))
 
             return DetectionResult(
                 score=float(score),
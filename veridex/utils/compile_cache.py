@@ -0,0 +1,72 @@
+"""
+Persistence for torch.compile artifacts across process runs.
+
+Compiling a causal LM with TorchInductor costs tens of seconds on the first
+forward pass. Torch's portable cache ("Mega-Cache") serializes the Inductor
+and Triton caches so later processes can skip that work. Artifacts are keyed
+by model, torch/CUDA version and GPU so a stale blob is never loaded on
+incompatible hardware.
+"""
+
+import atexit
+import os
+import re
+
+from veridex.utils.downloads import get_cache_dir
+
+_registered = set()
+
+
+def _artifact_path(model_id: str) -> str:
+    import torch
+
+    key = "_".join([
+        model_id,
+        torch.__version__,
+        str(torch.version.cuda),
+        torch.cuda.get_device_name(0) if torch.cuda.is_available() else "cpu",
+    ])
+    safe_key = re.sub(r"[^A-Za-z0-9._-]+", "-", key)
+    return os.path.join(get_cache_dir("compile"), f"{safe_key}_inductor.bin")
+
+
+def _save_artifacts(path: str) -> None:
+    import torch
+
+    try:
+        artifacts = torch.compiler.save_cache_artifacts()
+    except Exception:
+        return
+    if not artifacts:
+        return
+    with open(path, "wb") as f:
+        f.write(artifacts[0])
+
+
+def load_compile_cache(model_id: str) -> None:
+    """
+    Load cached compile artifacts for a model and save them again at exit.
+
+    Call this after wrapping a model in ``torch.compile`` and before its first
+    forward pass. Does nothing on torch versions without Mega-Cache support.
+
+    Args:
+        model_id: Identifier of the compiled model, e.g. a HuggingFace model ID.
+    """
+    import torch
+
+    compiler = getattr(torch, "compiler", None)
+    if not hasattr(compiler, "load_cache_artifacts"):
+        return
+
+    path = _artifact_path(model_id)
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                compiler.load_cache_artifacts(f.read())
+        except Exception:
+            pass  # Corrupt or incompatible blob; recompile from scratch
+
+    if path not in _registered:
+        _registered.add(path)
+        atexit.register(_save_artifacts, path)
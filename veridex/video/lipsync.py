@@ -1,18 +1,43 @@
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import os
+import threading
 import warnings
 import logging
 from veridex.core.signal import BaseSignal, DetectionResult
 
 logger = logging.getLogger(__name__)
 
+# Random 0.2s clips scored per run, in one SyncNet batch
+_N_SEGMENTS = 3
+
 class LipSyncSignal(BaseSignal):
     """
     Detects Deepfakes by checking Audio-Visual Synchronization (Lip-Sync).
     Uses SyncNet logic.
+
+    The SyncNet model and face detector are built on first use and reused
+    for every segment and call on this instance.
     """
 
+    def __init__(self, compile_model: bool = False, allow_bf16: bool = False):
+        """
+        Args:
+            compile_model: torch.compile SyncNet when it is built. Pays off
+                over many calls on one instance; off by default because the
+                compile adds seconds to the first call.
+            allow_bf16: Run SyncNet in bfloat16 on CPUs with native BF16
+                support. Faster there, but outputs shift slightly.
+        """
+        self.compile_model = compile_model
+        self.allow_bf16 = allow_bf16
+        self._model = None
+        self._weights_loaded = False
+        self._detector = None
+        self._mfcc = None
+        self._lock = threading.Lock()
+
     @property
     def name(self) -> str:
         return "lipsync_wav2lip"
@@ -35,20 +60,15 @@ class LipSyncSignal(BaseSignal):
             # 1. Load Audio and Video segments
             # For robustness, we check the AV offset on multiple random 0.2s clips
 
-            offsets = []
-            weights_loaded_flags = []
-            for _ in range(3): # Check 3 segments
-                offset, weights_loaded = self._calculate_av_offset(input_data)
-                if offset is not None:
-                    offsets.append(offset)
-                    weights_loaded_flags.append(weights_loaded)
+            segments = self._load_segments(input_data, n_segments=_N_SEGMENTS)
 
-            if not offsets:
+            if not segments:
                  return DetectionResult(score=0.5, confidence=0.0, error="Could not extract AV segments")
 
+            offsets, any_weights_loaded = self._calculate_av_offsets(segments)
+
             avg_offset = sum(offsets) / len(offsets)
             offset_variance = np.var(offsets) if len(offsets) > 1 else 0.0
-            any_weights_loaded = any(weights_loaded_flags)
 
             # Metric:
             # Offset is Euclidean distance between Audio and Video embeddings.
@@ -94,71 +114,137 @@ class LipSyncSignal(BaseSignal):
         except Exception as e:
             return DetectionResult(score=0.0, confidence=0.0, error=str(e))
 
-    def _calculate_av_offset(self, path: str) -> tuple[Optional[float], bool]:
-        """Calculate AV offset and return whether trained weights were loaded."""
-        import torch
+    def _load_segments(self, path: str, n_segments: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Extract up to `n_segments` random 0.2s audio/mouth segments.
+
+        The audio is decoded on a worker thread while the video frames are read
+        and mouths cropped on this one; both decodes release the GIL. Segment
+        start times come from the video duration so the frame reads need not
+        wait for the audio. Segments without a detectable face in every frame,
+        or past the end of the audio, are skipped.
+
+        Returns:
+            List of (mfcc, mouth_stack) pairs: MFCCs of shape (13, 20) and
+            five mouth crops stacked channel-wise to (112, 112, 15).
+        """
         import librosa
         import cv2
-        from veridex.video.models.syncnet import SyncNet
-        from veridex.video.processing import FaceDetector
-        from veridex.utils.downloads import download_file, get_cache_dir
+        import random
 
-        # 1. Load Audio (0.2s segment)
-        try:
-            y, sr = librosa.load(path, sr=16000)
-        except Exception:
-            return None, False
+        # 1. Load Audio (in the background)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            audio_future = executor.submit(librosa.load, path, sr=16000)
+
+            cap = cv2.VideoCapture(path)
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            if fps <= 0: fps = 25
+            duration = cap.get(cv2.CAP_PROP_FRAME_COUNT) / fps
+            if duration <= 0:
+                # No frame count in the container; fall back to the audio length
+                try:
+                    y, sr = audio_future.result()
+                except Exception:
+                    cap.release()
+                    return []
+                duration = len(y) / sr
+
+            detector = self._get_detector()
+            starts, mouth_stacks = [], []
+            try:
+                for _ in range(n_segments if duration >= 1.0 else 0):
+                    # Pick a random start point
+                    start_sec = random.uniform(0, duration - 0.3)
+
+                    # 2. Load Video (5 frames corresponding to that 0.2s)
+                    # 0.2s at 25fps = 5 frames.
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, int(start_sec * fps))
+                    frames = []
+                    for _ in range(5):
+                        ret, frame = cap.read()
+                        if not ret: break
+                        frames.append(frame)
+
+                    if len(frames) < 5:
+                        continue
+
+                    mouths = self._crop_mouths(detector, frames)
+                    if mouths is not None:
+                        starts.append(start_sec)
+                        mouth_stacks.append(mouths)
+            finally:
+                cap.release()
+
+            try:
+                y, sr = audio_future.result()
+            except Exception:
+                return []
 
         if len(y) < 16000: # Need at least 1 sec to find a good chunk
-            return None, False
+            return []
 
-        # Pick a random start point
-        import random
-        start_sec = random.uniform(0, len(y)/sr - 0.3)
-        start_sample = int(start_sec * sr)
         # 0.2s duration for SyncNet
         duration_samples = int(0.2 * sr)
-        audio_chunk = y[start_sample : start_sample + duration_samples]
-
+        chunks, kept = [], []
+        for start_sec, mouths in zip(starts, mouth_stacks):
+            start_sample = int(start_sec * sr)
+            audio_chunk = y[start_sample : start_sample + duration_samples]
+            if len(audio_chunk) == duration_samples:
+                chunks.append(audio_chunk)
+                kept.append(mouths)
+
+        if not chunks:
+            return []
+        return list(zip(self._compute_mfccs(chunks, sr), kept))
+
+    def _compute_mfccs(self, chunks: List[np.ndarray], sr: int) -> np.ndarray:
+        """
+        MFCCs for equal-length audio chunks.
+
+        Uses a cached torchaudio transform (one batched call) when torchaudio
+        is installed, otherwise librosa per chunk.
+
+        Returns:
+            Array of shape (N, 13, 20).
+        """
         # MFCC: 13 coeffs, window 25ms, hop 10ms
         # SyncNet expects specific MFCC shape.
         # (1, 1, 13, 20) -> 13 MFCCs over 20 timesteps (20*10ms = 200ms)
-        mfcc = librosa.feature.mfcc(y=audio_chunk, sr=sr, n_mfcc=13, n_fft=400, hop_length=160)
-        if mfcc.shape[1] < 20:
-             mfcc = np.pad(mfcc, ((0,0), (0, 20-mfcc.shape[1])))
-        mfcc = mfcc[:, :20]
-
-        # 2. Load Video (5 frames corresponding to that 0.2s)
-        # 0.2s at 25fps = 5 frames.
-        cap = cv2.VideoCapture(path)
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        if fps <= 0: fps = 25
-
-        start_frame = int(start_sec * fps)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-
-        frames = []
-        for _ in range(5):
-            ret, frame = cap.read()
-            if not ret: break
-            frames.append(frame)
-        cap.release()
-
-        if len(frames) < 5:
-            return None, False
+        transform = self._get_mfcc()
+        if transform is not None:
+            import torch
+            # (N, 1, samples): a channel axis keeps the 80 dB floor per chunk
+            audio = torch.from_numpy(np.stack(chunks)[:, None]).float()
+            with torch.inference_mode():
+                mfccs = transform(audio)[:, 0].numpy()
+        else:
+            import librosa
+            mfccs = np.stack([
+                librosa.feature.mfcc(y=chunk, sr=sr, n_mfcc=13, n_fft=400, hop_length=160)
+                for chunk in chunks
+            ])
 
+        if mfccs.shape[-1] < 20:
+            mfccs = np.pad(mfccs, ((0, 0), (0, 0), (0, 20 - mfccs.shape[-1])))
+        return mfccs[..., :20]
+
+    @staticmethod
+    def _crop_mouths(detector, frames: List[np.ndarray]) -> Optional[np.ndarray]:
         # 3. Detect and Crop Mouth
         # Simplified: Detect face, take lower half.
-        detector = FaceDetector()
         face_crops = []
-        for frame in frames:
-            dets = detector.detect(frame)
-            if not dets:
-                # Fallback: center crop? Or just fail this segment
-                return None, False
-
-            # Largest face
-            face = max(dets, key=lambda b: b[2] * b[3])
+        face = None
+        for i, frame in enumerate(frames):
+            # The face barely moves within 0.2s: detect on every other frame
+            # and reuse the box in between
+            if i % 2 == 0:
+                dets = detector.detect(frame)
+                if not dets:
+                    # Fallback: center crop? Or just fail this segment
+                    return None
+
+                # Largest face
+                face = max(dets, key=lambda b: b[2] * b[3])
             x, y, w, h = face
 
             # Mouth region approximation (lower half of face)
@@ -171,19 +257,82 @@ class LipSyncSignal(BaseSignal):
         # Stack frames
         # Input: (B, 15, 112, 112). 15 channels = 5 frames * 3 colors.
         # face_crops: 5 * (112, 112, 3)
-        video_tensor = np.concatenate(face_crops, axis=2) # (112, 112, 15)
+        return np.concatenate(face_crops, axis=2) # (112, 112, 15)
+
+    def _calculate_av_offsets(self, segments: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[List[float], bool]:
+        """Score all segments in one SyncNet forward; returns (distances, weights_loaded)."""
+        import torch
+        from veridex.video.models.compilation import inference_dtype
 
-        # To Torch
-        audio_t = torch.from_numpy(mfcc).float().unsqueeze(0).unsqueeze(0) # (1, 1, 13, 20)
-        video_t = torch.from_numpy(video_tensor).float().permute(2, 0, 1).unsqueeze(0) # (1, 15, 112, 112)
+        dtype = inference_dtype(self.allow_bf16)
+        audio_b = torch.from_numpy(np.stack([m for m, _ in segments])).to(dtype).unsqueeze(1) # (B, 1, 13, 20)
+        video_b = torch.from_numpy(np.stack([v for _, v in segments])).to(dtype).permute(0, 3, 1, 2) # (B, 15, 112, 112)
 
         # 4. Inference
+        model, weights_loaded = self._load_model()
+
+        with torch.no_grad():
+            a_emb, v_emb = model(audio_b, video_b)
+            dists = torch.norm((a_emb - v_emb).float(), p=2, dim=1)
+
+        return dists.tolist(), weights_loaded
+
+    def _get_detector(self):
+        """Return the face detector, creating it on first use."""
+        with self._lock:
+            if self._detector is None:
+                from veridex.video.processing import FaceDetector
+                self._detector = FaceDetector()
+            return self._detector
+
+    def _get_mfcc(self):
+        """
+        Return the torchaudio MFCC transform, creating it on first use, or None
+        when torchaudio is not installed.
+
+        Configured to match librosa.feature.mfcc defaults (Slaney mel scale,
+        zero-padded centred frames, power to dB with an 80 dB floor).
+        """
+        with self._lock:
+            if self._mfcc is None:
+                try:
+                    import torchaudio
+                    self._mfcc = torchaudio.transforms.MFCC(
+                        sample_rate=16000,
+                        n_mfcc=13,
+                        norm="ortho",
+                        melkwargs={
+                            "n_fft": 400,
+                            "hop_length": 160,
+                            "n_mels": 128,
+                            "mel_scale": "slaney",
+                            "norm": "slaney",
+                            "pad_mode": "constant",
+                        },
+                    )
+                except (ImportError, AttributeError):
+                    self._mfcc = False
+            return self._mfcc if self._mfcc is not False else None
+
+    def _load_model(self):
+        """Build SyncNet and load its weights once; returns (model, weights_loaded)."""
+        with self._lock:
+            if self._model is None:
+                self._model, self._weights_loaded = self._build_model()
+            return self._model, self._weights_loaded
+
+    def _build_model(self):
+        import torch
+        from veridex.video.models.syncnet import SyncNet
+        from veridex.video.models.compilation import compile_for_inference, inference_dtype
+        from veridex.video.models.fusion import fuse_conv_bn
+        from veridex.utils.downloads import download_file, get_cache_dir
+        from veridex.video.weights import get_weight_config
+
         model = SyncNet()
         model.eval()
 
         # Load weights from centralized config
-        from veridex.video.weights import get_weight_config
-        
         weight_config = get_weight_config('syncnet')
         weights_url = weight_config['url']
         weights_path = os.path.join(get_cache_dir(), weight_config['filename'])
@@ -200,7 +349,9 @@ class LipSyncSignal(BaseSignal):
              try:
                 # Note: Official weights might be LuaTorch or different format.
                 # This assumes a PyTorch converted version or compatible dict.
-                model.load_state_dict(torch.load(weights_path, map_location='cpu'))
+                # weights_only: plain state dicts load as before; pickled full-model
+                # checkpoints are refused instead of unpickled (arbitrary code)
+                model.load_state_dict(torch.load(weights_path, map_location='cpu', weights_only=True))
                 logger.info(f"✓ Loaded SyncNet weights from {weights_path}")
                 weights_loaded = True
              except Exception:
@@ -214,8 +365,18 @@ class LipSyncSignal(BaseSignal):
                 stacklevel=2
             )
 
-        with torch.no_grad():
-            a_emb, v_emb = model(audio_t, video_t)
-            dist = torch.norm(a_emb - v_emb, p=2, dim=1).item()
+        # Fold BatchNorm into the preceding convs now that weights are final
+        fuse_conv_bn(model)
+        # Cast after fusing so the folded BN constants are in the same dtype
+        dtype = inference_dtype(self.allow_bf16)
+        model.to(dtype)
+        if self.compile_model:
+            # Warm up on the batch run() sends: (B, 1, 13, 20) MFCCs and
+            # (B, 15, 112, 112) mouth crops for every segment
+            model = compile_for_inference(
+                model,
+                torch.zeros(_N_SEGMENTS, 1, 13, 20, dtype=dtype),
+                torch.zeros(_N_SEGMENTS, 15, 112, 112, dtype=dtype),
+            )
 
-        return dist, weights_loaded
+        return model, weights_loaded
@@ -0,0 +1,66 @@
+import functools
+from typing import Optional
+
+import torch
+import torch.nn as nn
+
+
+@functools.lru_cache(maxsize=None)
+def inference_dtype(allow_bf16: bool = False) -> torch.dtype:
+    """
+    Dtype to run the video models in.
+
+    float32 unless `allow_bf16` is set and the CPU has native BF16 support
+    (AVX512-BF16 or AMX) through oneDNN. BF16 rounding shifts outputs
+    slightly, and LipSync compares distances against absolute thresholds,
+    so reduced precision is opt-in.
+    """
+    if not allow_bf16:
+        return torch.float32
+    if not torch.backends.mkldnn.is_available():
+        return torch.float32
+    cpu = getattr(torch, "cpu", None)
+    for probe in ("_is_avx512_bf16_supported", "_is_amx_tile_supported"):
+        check = getattr(cpu, probe, None)
+        if check is not None and check():
+            return torch.bfloat16
+    return torch.float32
+
+
+def compile_for_inference(
+    model: nn.Module, *example_inputs: torch.Tensor, dynamic: Optional[bool] = None
+) -> nn.Module:
+    """
+    Wrap a model in torch.compile and warm it up on example inputs.
+
+    Compilation is lazy, so the warm-up forward is what actually builds the
+    kernels. If that fails (e.g. no C++ toolchain for Inductor on CPU) a
+    frozen TorchScript module is tried next, and if scripting fails too the
+    eager model is returned unchanged.
+
+    Args:
+        model: Module in eval mode.
+        *example_inputs: Inputs with the shapes the model will usually see.
+        dynamic: Passed to torch.compile; True builds one graph for varying
+            input sizes instead of recompiling per shape.
+
+    Returns:
+        The compiled or scripted module, or ``model`` itself if both failed.
+    """
+    try:
+        compiled = torch.compile(model, fullgraph=True, dynamic=dynamic)
+        with torch.no_grad():
+            compiled(*example_inputs)
+        return compiled
+    except Exception:
+        pass
+
+    try:
+        scripted = torch.jit.freeze(torch.jit.script(model))
+        # The profiling executor specializes on the first few calls
+        with torch.no_grad():
+            for _ in range(2):
+                scripted(*example_inputs)
+        return scripted
+    except Exception:
+        return model
@@ -0,0 +1,33 @@
+import torch.nn as nn
+from torch.nn.utils.fusion import fuse_conv_bn_eval
+
+_CONV_BN = (
+    (nn.Conv2d, nn.BatchNorm2d),
+    (nn.Conv3d, nn.BatchNorm3d),
+)
+
+
+def fuse_conv_bn(model: nn.Module) -> nn.Module:
+    """
+    Fold every BatchNorm that directly follows a Conv inside an nn.Sequential
+    into that Conv's weight and bias, in place.
+
+    The BatchNorm is replaced by nn.Identity so Sequential indices (and any
+    code relying on them) stay stable. Only valid for inference: call after
+    loading weights and switching the model to eval mode.
+
+    Args:
+        model: Module in eval mode.
+
+    Returns:
+        The same module, for chaining.
+    """
+    for seq in model.modules():
+        if not isinstance(seq, nn.Sequential):
+            continue
+        for i in range(len(seq) - 1):
+            conv, bn = seq[i], seq[i + 1]
+            if any(isinstance(conv, c) and isinstance(bn, b) for c, b in _CONV_BN):
+                seq[i] = fuse_conv_bn_eval(conv, bn)
+                seq[i + 1] = nn.Identity()
+    return model
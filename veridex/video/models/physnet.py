@@ -13,23 +13,23 @@ class PhysNet(nn.Module):
         self.encoder = nn.Sequential(
             nn.Conv3d(in_channels, 32, kernel_size=(1, 5, 5), stride=1, padding=(0, 2, 2)),
             nn.BatchNorm3d(32),
-            nn.ELU(),
+            nn.ELU(inplace=True),
             nn.MaxPool3d((1, 2, 2), stride=(1, 2, 2)),
 
             nn.Conv3d(32, 64, kernel_size=(3, 3, 3), stride=1, padding=(1, 1, 1)),
             nn.BatchNorm3d(64),
-            nn.ELU(),
+            nn.ELU(inplace=True),
             nn.Conv3d(64, 64, kernel_size=(3, 3, 3), stride=1, padding=(1, 1, 1)),
             nn.BatchNorm3d(64),
-            nn.ELU(),
+            nn.ELU(inplace=True),
             nn.MaxPool3d((1, 2, 2), stride=(1, 2, 2)),
 
             nn.Conv3d(64, 64, kernel_size=(3, 3, 3), stride=1, padding=(1, 1, 1)),
             nn.BatchNorm3d(64),
-            nn.ELU(),
+            nn.ELU(inplace=True),
             nn.Conv3d(64, 64, kernel_size=(3, 3, 3), stride=1, padding=(1, 1, 1)),
             nn.BatchNorm3d(64),
-            nn.ELU(),
+            nn.ELU(inplace=True),
             nn.MaxPool3d((1, 2, 2), stride=(1, 2, 2)),
         )
 
@@ -15,7 +15,9 @@ class SyncNet(nn.Module):
             nn.Conv2d(1, 64, kernel_size=(3, 3), stride=(1, 1), padding=(1, 1)),
             nn.BatchNorm2d(64),
             nn.ReLU(inplace=True),
-            nn.MaxPool2d(kernel_size=(1, 1), stride=(1, 1)),
+            # A 1x1 pool is a copy; Identity keeps the Sequential indices (and
+            # so checkpoint keys) unchanged
+            nn.Identity(),
 
             nn.Conv2d(64, 128, kernel_size=(3, 3), stride=(1, 1), padding=(1, 1)),
             nn.BatchNorm2d(128),
@@ -67,8 +69,8 @@ class SyncNet(nn.Module):
         v = self.face_encoder(video)
 
         # Flatten
-        a = a.view(a.size(0), -1)
-        v = v.view(v.size(0), -1)
+        a = a.reshape(a.size(0), -1)
+        v = v.reshape(v.size(0), -1)
 
         a = self.audio_fc(a)
         v = self.face_fc(v)
@@ -1,8 +1,12 @@
 from typing import List, Tuple, Optional, Literal
 import numpy as np
+import os
 import warnings
 
-FaceBackend = Literal['haar', 'mediapipe', 'auto']
+FaceBackend = Literal['haar', 'mediapipe', 'yunet', 'auto']
+
+# Search images wider than this are downscaled before detection
+_DETECT_WIDTH = 480
 
 class FaceDetector:
     """
@@ -10,10 +14,12 @@ class FaceDetector:
     
     Backends (in order of accuracy):
     1. MediaPipe (best, requires mediapipe package)
-    2. Haar Cascades (fast, less accurate)
+    2. YuNet (OpenCV DNN detector, requires opencv>=4.5.4; downloads a ~230 KB
+       ONNX model on first use and runs on CUDA when OpenCV is built with it)
+    3. Haar Cascades (fast, less accurate)
     
     Args:
-        backend: 'auto' (try MediaPipe then Haar), 'mediapipe', or 'haar'
+        backend: 'auto' (try MediaPipe then Haar), 'mediapipe', 'yunet', or 'haar'
     """
     def __init__(self, backend: FaceBackend = 'auto'):
         try:
@@ -23,6 +29,8 @@ class FaceDetector:
             raise ImportError("FaceDetector requires 'opencv-python-headless'. Please install veridex[video].")
         
         self.backend = backend
+        # Reused grayscale buffer for the Haar backend
+        self._gray_buf: Optional[np.ndarray] = None
         
         if backend == 'auto':
             # Try MediaPipe first, fallback to Haar
@@ -40,10 +48,12 @@ class FaceDetector:
                 self._init_haar()
         elif backend == 'mediapipe':
             self._init_mediapipe()
+        elif backend == 'yunet':
+            self._init_yunet()
         elif backend == 'haar':
             self._init_haar()
         else:
-            raise ValueError(f"Unknown backend: {backend}. Use 'auto', 'mediapipe', or 'haar'")
+            raise ValueError(f"Unknown backend: {backend}. Use 'auto', 'mediapipe', 'yunet', or 'haar'")
     
     def _init_mediapipe(self):
         """Initialize MediaPipe Face Detection."""
@@ -54,25 +64,79 @@ class FaceDetector:
             min_detection_confidence=0.5
         )
         
+    def _init_yunet(self):
+        """Initialize the YuNet DNN face detector."""
+        if not hasattr(self.cv2, 'FaceDetectorYN'):
+            raise ImportError("The 'yunet' backend requires opencv-python-headless>=4.5.4.")
+
+        from veridex.utils.downloads import download_file, get_cache_dir
+        from veridex.video.weights import get_weight_config
+
+        config = get_weight_config('yunet')
+        model_path = os.path.join(get_cache_dir(), config['filename'])
+        if not os.path.exists(model_path):
+            download_file(config['url'], model_path, sha256=config.get('sha256'))
+
+        backend_id, target_id = self.cv2.dnn.DNN_BACKEND_DEFAULT, self.cv2.dnn.DNN_TARGET_CPU
+        try:
+            if self.cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                backend_id, target_id = self.cv2.dnn.DNN_BACKEND_CUDA, self.cv2.dnn.DNN_TARGET_CUDA
+        except (AttributeError, self.cv2.error):
+            pass  # OpenCV built without CUDA
+
+        # Input size is a placeholder; it is set per frame size in _detect_yunet
+        self.detector = self.cv2.FaceDetectorYN.create(
+            model_path, "", (320, 320), 0.6, 0.3, 5000, backend_id, target_id
+        )
+        self._yunet_size = None
+
     def _init_haar(self):
         """Initialize Haar Cascade Face Detection."""
         cascade_path = self.cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
         self.detector = self.cv2.CascadeClassifier(cascade_path)
 
-    def detect(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    def detect(
+        self,
+        frame: np.ndarray,
+        roi: Optional[Tuple[int, int, int, int]] = None,
+        scale: Optional[float] = None,
+    ) -> List[Tuple[int, int, int, int]]:
         """
         Detect faces in a frame.
 
         Args:
             frame: RGB or BGR numpy array (OpenCV uses BGR).
+            roi: Optional (x, y, w, h) region to search, clipped to the frame.
+            scale: Optional factor (e.g. 0.5) to resize the search image by
+                before detection.
 
         Returns:
-            List of (x, y, w, h) tuples.
+            List of (x, y, w, h) tuples in full-frame coordinates.
         """
+        ox = oy = 0
+        if roi is not None:
+            x, y, w, h = roi
+            h_img, w_img = frame.shape[:2]
+            ox, oy = max(0, x), max(0, y)
+            x1, y1 = min(w_img, x + w), min(h_img, y + h)
+            if x1 <= ox or y1 <= oy:
+                return []
+            frame = frame[oy:y1, ox:x1]
+        if scale is not None and scale != 1.0:
+            frame = self.cv2.resize(frame, None, fx=scale, fy=scale, interpolation=self.cv2.INTER_AREA)
+
         if self.backend == 'mediapipe':
-            return self._detect_mediapipe(frame)
+            dets = self._detect_mediapipe(frame)
+        elif self.backend == 'yunet':
+            dets = self._detect_yunet(frame)
         else:
-            return self._detect_haar(frame)
+            dets = self._detect_haar(frame)
+
+        if scale is not None and scale != 1.0:
+            dets = [tuple(int(round(v / scale)) for v in d) for d in dets]
+        if ox or oy:
+            dets = [(x + ox, y + oy, w, h) for x, y, w, h in dets]
+        return dets
     
     def _detect_mediapipe(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """Detect faces using MediaPipe."""
@@ -100,9 +164,24 @@ class FaceDetector:
         
         return bboxes
     
+    def _detect_yunet(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """Detect faces using YuNet."""
+        h, w = frame.shape[:2]
+        if self._yunet_size != (w, h):
+            self.detector.setInputSize((w, h))
+            self._yunet_size = (w, h)
+
+        _, faces = self.detector.detect(frame)
+        if faces is None:
+            return []
+        # Rows are [x, y, w, h, 5 landmark pairs, score]
+        return [tuple(int(v) for v in face[:4]) for face in faces]
+
     def _detect_haar(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """Detect faces using Haar Cascades."""
-        gray = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2GRAY)
+        if self._gray_buf is None or self._gray_buf.shape != frame.shape[:2]:
+            self._gray_buf = np.empty(frame.shape[:2], dtype=np.uint8)
+        gray = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
         faces = self.detector.detectMultiScale(
             gray,
             scaleFactor=1.1,
@@ -112,9 +191,18 @@ class FaceDetector:
         )
         return [tuple(f) for f in faces]
 
-    def extract_face(self, frame: np.ndarray, bbox: Tuple[int, int, int, int], size: Tuple[int, int] = (128, 128)) -> np.ndarray:
+    def extract_face(
+        self,
+        frame: np.ndarray,
+        bbox: Tuple[int, int, int, int],
+        size: Tuple[int, int] = (128, 128),
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """
         Extract and resize the face ROI.
+
+        If `out` is given (shape (h, w, 3), frame dtype) the crop is resized
+        into it and it is returned.
         """
         x, y, w, h = bbox
         # Ensure bounds
@@ -126,24 +214,55 @@ class FaceDetector:
         
         face = frame[y:y+h, x:x+w]
         if face.size == 0 or w == 0 or h == 0:
+            if out is not None:
+                out[...] = 0
+                return out
             return np.zeros((size[1], size[0], 3), dtype=frame.dtype)
+        if out is not None:
+            self.cv2.resize(face, size, dst=out)
+            return out
         return self.cv2.resize(face, size)
 
-    def track_faces(self, frames: List[np.ndarray], size: Tuple[int, int] = (128, 128)) -> np.ndarray:
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """32x32 grayscale thumbnail used to measure frame-to-frame motion."""
+        gray = self.cv2.cvtColor(frame, self.cv2.COLOR_BGR2GRAY)
+        return self.cv2.resize(gray, (32, 32), interpolation=self.cv2.INTER_AREA).astype(np.float32)
+
+    def track_faces(
+        self,
+        frames: List[np.ndarray],
+        size: Tuple[int, int] = (128, 128),
+        detect_every: int = 1,
+        motion_threshold: Optional[float] = None,
+        reduce_rgb: bool = False,
+    ) -> np.ndarray:
         """
         Track and extract a single face across a sequence of frames.
         Uses simple IoU tracking and 'largest face' initialization.
+
+        Args:
+            frames: Frames to track through.
+            size: Output ROI size (w, h).
+            detect_every: Run the detector on at most every N-th frame and keep
+                the tracked box in between. 1 detects on every frame.
+            motion_threshold: If set, also re-detect early when the mean absolute
+                difference between 32x32 grayscale thumbnails of the current frame
+                and the last detected frame exceeds this value (0-255 scale).
+            reduce_rgb: Return only the mean colour of each frame's ROI, shape
+                (T, 3) float32, instead of resized (T, h, w, 3) crops.
+
+        Returns:
+            The ROIs, or an empty array if no face is found in any frame.
         """
-        roi_frames = []
         if not frames:
-            return np.array(roi_frames)
+            return np.array([])
 
         # 1. Init on first frame
         current_bbox = None
         
         # Try finding face in first few frames if missing in 0
         for i, frame in enumerate(frames):
-            dets = self.detect(frame)
+            dets = self.detect(frame, scale=self._search_scale(frame.shape[1]))
             if dets:
                 # Pick largest
                 current_bbox = max(dets, key=lambda b: b[2] * b[3])
@@ -151,52 +270,111 @@ class FaceDetector:
         
         if current_bbox is None:
             # No face found in entire video (or start)
-            # Return zeros
-            return np.zeros((len(frames), size[1], size[0], 3), dtype=np.uint8)
+            # Zero-filled ROIs would look like a (flat) signal downstream
+            if reduce_rgb:
+                return np.empty((0, 3), dtype=np.float32)
+            return np.empty((0, size[1], size[0], 3), dtype=np.uint8)
+
+        # ROIs are written straight into one preallocated output
+        if reduce_rgb:
+            roi_frames = np.empty((len(frames), 3), dtype=np.float32)
+
+            def emit(k, frame, bbox):
+                roi_frames[k] = self._roi_mean(frame, bbox)
+        else:
+            roi_frames = np.empty((len(frames), size[1], size[0], 3), dtype=frames[0].dtype)
+
+            def emit(k, frame, bbox):
+                self.extract_face(frame, bbox, size, out=roi_frames[k])
 
         # Backfill missing start
-        for _ in range(i):
-             roi_frames.append(self.extract_face(frames[0], current_bbox, size))
+        if i:
+            emit(0, frames[0], current_bbox)
+            roi_frames[1:i] = roi_frames[0]
 
         # 2. Track
-        for frame in frames[i:]:
-            dets = self.detect(frame)
-            if not dets:
-                # Lost detection, keep previous bbox
-                pass 
-            else:
-                # Find bbox with best overlap (IoU) with current_bbox
-                best_iou = -1.0
-                best_box = None
-                
-                cx, cy, cw, ch = current_bbox
-                c_area = cw * ch
-                
-                for box in dets:
-                    bx, by, bw, bh = box
-                    # IoU calc
-                    ix = max(cx, bx)
-                    iy = max(cy, by)
-                    iw = min(cx+cw, bx+bw) - ix
-                    ih = min(cy+ch, by+bh) - iy
-                    
-                    if iw > 0 and ih > 0:
-                        inter = iw * ih
-                        union = c_area + (bw * bh) - inter
-                        iou = inter / union
-                        if iou > best_iou:
-                            best_iou = iou
-                            best_box = box
-                
-                if best_box is not None and best_iou > 0.1: # Threshold for tracking drift
-                    current_bbox = best_box
-                else:
-                    # If all detections are far away, it might be a new face or false positive.
-                    # For RPPG we usually want to STICK to the subject.
-                    # Keep previous bbox.
-                    pass
-            
+        # frames[i] was just detected on; count frames since the last detection
+        anchor_thumb = self._thumbnail(frames[i]) if motion_threshold is not None else None
+        since_detect = 0
+        for k in range(i, len(frames)):
+            frame = frames[k]
+            due = since_detect >= detect_every
+            thumb = None
+            if not due and since_detect > 0 and motion_threshold is not None:
+                thumb = self._thumbnail(frame)
+                due = float(np.mean(np.abs(thumb - anchor_thumb))) > motion_threshold
+
+            if due:
+                since_detect = 0
+                if motion_threshold is not None:
+                    anchor_thumb = thumb if thumb is not None else self._thumbnail(frame)
+                # The face moves little between detections: search around it only
+                roi = self._expand(current_bbox, 1.5)
+                dets = self.detect(frame, roi=roi, scale=self._search_scale(roi[2]))
+                current_bbox = self._follow(current_bbox, dets)
+            since_detect += 1
+
             # Extract
-            roi_frames.append(self.extract_face(frame, current_bbox, size))
+            emit(k, frame, current_bbox)
             
-        return np.array(roi_frames)
+        return roi_frames
+
+    @staticmethod
+    def _search_scale(width: int) -> Optional[float]:
+        """Downscale factor bringing a search image to _DETECT_WIDTH, if wider."""
+        return _DETECT_WIDTH / width if width > _DETECT_WIDTH else None
+
+    @staticmethod
+    def _expand(bbox: Tuple[int, int, int, int], factor: float) -> Tuple[int, int, int, int]:
+        """Grow a bbox about its centre by `factor` (not clipped to the frame)."""
+        x, y, w, h = bbox
+        new_w, new_h = int(w * factor), int(h * factor)
+        return (x - (new_w - w) // 2, y - (new_h - h) // 2, new_w, new_h)
+
+    @staticmethod
+    def _roi_mean(frame: np.ndarray, bbox: Tuple[int, int, int, int]) -> np.ndarray:
+        """Mean colour of the bbox region (clipped to the frame), as float32."""
+        x, y, w, h = bbox
+        x = max(0, x)
+        y = max(0, y)
+        region = frame[y:y+h, x:x+w]
+        if region.size == 0:
+            return np.zeros(frame.shape[-1], dtype=np.float32)
+        return region.reshape(-1, region.shape[-1]).mean(axis=0, dtype=np.float32)
+
+    @staticmethod
+    def _follow(current_bbox: Tuple[int, int, int, int], dets: List[Tuple[int, int, int, int]]) -> Tuple[int, int, int, int]:
+        """Pick the detection that best overlaps the tracked box, or keep the box."""
+        if not dets:
+            # Lost detection, keep previous bbox
+            return current_bbox
+
+        # Find bbox with best overlap (IoU) with current_bbox
+        best_iou = -1.0
+        best_box = None
+        
+        cx, cy, cw, ch = current_bbox
+        c_area = cw * ch
+        
+        for box in dets:
+            bx, by, bw, bh = box
+            # IoU calc
+            ix = max(cx, bx)
+            iy = max(cy, by)
+            iw = min(cx+cw, bx+bw) - ix
+            ih = min(cy+ch, by+bh) - iy
+            
+            if iw > 0 and ih > 0:
+                inter = iw * ih
+                union = c_area + (bw * bh) - inter
+                iou = inter / union
+                if iou > best_iou:
+                    best_iou = iou
+                    best_box = box
+        
+        if best_box is not None and best_iou > 0.1: # Threshold for tracking drift
+            return best_box
+        # If all detections are far away, it might be a new face or false positive.
+        # For RPPG we usually want to STICK to the subject.
+        # Keep previous bbox.
+        return current_bbox
@@ -1,6 +1,7 @@
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Dict, Optional, Tuple
 import numpy as np
 import os
+import threading
 import warnings
 import logging
 from veridex.core.signal import BaseSignal, DetectionResult
@@ -8,12 +9,100 @@ from veridex.utils.downloads import download_file, get_cache_dir
 
 logger = logging.getLogger(__name__)
 
+
+def chrom_bvp(rgb_trace: np.ndarray, fs: float = 30.0) -> np.ndarray:
+    """
+    Blood volume pulse from a (T, 3) mean-RGB skin trace with CHROM
+    (de Haan & Jeanne, 2013).
+
+    Args:
+        rgb_trace: Per-frame spatial mean of the face ROI, RGB order.
+        fs: Frame rate in Hz.
+
+    Returns:
+        (T,) BVP signal band-passed to 0.7-4 Hz.
+    """
+    from scipy import signal as scipy_signal
+
+    # Normalize each channel by its temporal mean to cancel illumination level
+    means = rgb_trace.mean(axis=0)
+    means[means == 0] = 1.0
+    r, g, b = (rgb_trace / means).T
+
+    x = 3.0 * r - 2.0 * g
+    y = 1.5 * r + g - 1.5 * b
+
+    sos = scipy_signal.butter(4, [0.7, 4.0], btype="band", fs=fs, output="sos")
+    padlen = min(3 * (2 * len(sos) + 1), len(x) - 1)
+    xf = scipy_signal.sosfiltfilt(sos, x, padlen=padlen)
+    yf = scipy_signal.sosfiltfilt(sos, y, padlen=padlen)
+
+    alpha = np.std(xf) / (np.std(yf) + 1e-8)
+    return xf - alpha * yf
+
+
+def detrended_psd(signal: np.ndarray, fs: float = 30.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One-sided power spectral density of a linearly detrended signal.
+
+    Matches ``scipy.signal.periodogram(scipy.signal.detrend(signal), fs)``
+    (boxcar window, density scaling) with a single real FFT.
+
+    Args:
+        signal: (T,) signal.
+        fs: Sampling rate in Hz.
+
+    Returns:
+        Tuple of (freqs, psd), each of shape (T // 2 + 1,).
+    """
+    x = np.asarray(signal, dtype=np.float64)
+    n = len(x)
+
+    # Least-squares line removal; centring t decouples slope and offset
+    x = x - x.mean()
+    if n > 1:
+        t = np.arange(n) - (n - 1) / 2.0
+        x -= t * (np.dot(t, x) / np.dot(t, t))
+
+    spectrum = np.fft.rfft(x)
+    psd = (spectrum.real ** 2 + spectrum.imag ** 2) / (fs * n)
+    # Fold negative frequencies in; DC and (for even n) Nyquist have no mirror
+    psd[1:n // 2 + (n % 2)] *= 2
+    return np.fft.rfftfreq(n, 1.0 / fs), psd
+
+def _trapz_uniform(y: np.ndarray, dx: float) -> float:
+    """Trapezoidal integral of samples spaced `dx` apart (np.trapz without x)."""
+    if len(y) < 2:
+        return 0.0
+    return float(dx * (y.sum() - 0.5 * (y[0] + y[-1])))
+
 class RPPGSignal(BaseSignal):
     """
     Detects Deepfakes by analyzing the rPPG (Remote Photoplethysmography) signal.
     Real humans have a heartbeat (0.7-4Hz). Deepfakes often lack this or have noise.
+
+    The BVP signal comes from PhysNet when trained weights are available, and
+    from the CHROM algorithm otherwise (an untrained PhysNet only yields noise).
+    The PhysNet model and face detector are built on first use and reused
+    across calls on this instance.
     """
 
+    def __init__(self, compile_model: bool = False, allow_bf16: bool = False):
+        """
+        Args:
+            compile_model: torch.compile a trained PhysNet when it is built.
+                Pays off over many calls on one instance; off by default
+                because the compile adds seconds to the first call.
+            allow_bf16: Run PhysNet in bfloat16 on CPUs with native BF16
+                support. Faster there, but outputs shift slightly.
+        """
+        self.compile_model = compile_model
+        self.allow_bf16 = allow_bf16
+        self._model = None
+        self._weights_loaded = False
+        self._detector = None
+        self._lock = threading.Lock()
+
     @property
     def name(self) -> str:
         return "rppg_physnet"
@@ -59,13 +148,23 @@ class RPPGSignal(BaseSignal):
                     error="No face detected"
                 )
 
-            # Extract BVP Signal - track if using trained weights
-            bvp_signal, weights_loaded = self._extract_signal(faces)
+            # A constant ROI colour (e.g. zero-filled frames) carries no pulse;
+            # CHROM/PSD would still turn it into a confident-looking score
+            if self._is_flat(faces):
+                return DetectionResult(
+                    score=0.5,
+                    confidence=0.0,
+                    metadata={"error": "Face ROI has no colour variation"},
+                    error="Face ROI has no colour variation"
+                )
+
+            # Extract BVP Signal - PhysNet if trained, CHROM otherwise
+            bvp_signal, method = self._extract_signal(faces)
 
             # Analyze PSD
             fake_prob, meta = self._analyze_psd(bvp_signal)
             
-            # Calculate confidence based on signal quality and model training status
+            # Calculate confidence based on signal quality
             peak_ratio = meta.get("peak_ratio", 0.0)
             snr = meta.get("snr", 0.0)
             
@@ -80,67 +179,172 @@ class RPPGSignal(BaseSignal):
                 signal_confidence = 0.50
             else:
                 signal_confidence = 0.35  # Weak/noisy signal
-            
-            # Adjust by model training status
-            if weights_loaded:
-                # Trained model: use higher portion of signal confidence
-                confidence = signal_confidence
-            else:
-                # Untrained model: significantly reduce confidence
-                confidence = min(signal_confidence * 0.3, 0.4)  # Cap at 0.4 for untrained
 
             return DetectionResult(
                 score=fake_prob,
-                confidence=confidence,
-                metadata={**meta, "model_trained": weights_loaded}
+                confidence=signal_confidence,
+                metadata={**meta, "model_trained": method == "physnet", "bvp_method": method}
             )
 
         except Exception as e:
             return DetectionResult(score=0.0, confidence=0.0, error=str(e))
 
     def _load_video_frames(self, path: str, max_frames: int = 300) -> np.ndarray:
+        """
+        Decode up to `max_frames` RGB frames into one preallocated uint8 array.
+
+        Uses PyAV when installed (threaded decode with RGB conversion inside
+        FFmpeg), otherwise OpenCV with the BGR->RGB conversion written straight
+        into the output buffer.
+        """
+        try:
+            import av
+            open_container = av.open
+        except (ImportError, AttributeError):
+            open_container = None
+
+        if open_container is not None:
+            try:
+                return self._decode_av(open_container, path, max_frames)
+            except Exception:
+                pass  # Fall back to OpenCV for containers PyAV cannot read
+        return self._decode_cv2(path, max_frames)
+
+    @staticmethod
+    def _ensure_capacity(buffer: Optional[np.ndarray], count: int, shape: Tuple[int, ...], capacity: int) -> np.ndarray:
+        """Allocate the frame buffer on first use, or double it when full."""
+        if buffer is None:
+            return np.empty((capacity,) + shape, dtype=np.uint8)
+        if count == len(buffer):
+            return np.concatenate([buffer, np.empty_like(buffer)])
+        return buffer
+
+    def _decode_av(self, open_container, path: str, max_frames: int) -> np.ndarray:
+        container = open_container(path)
+        try:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            # Frame count from the header is only an estimate; the buffer grows if needed
+            capacity = min(max_frames, stream.frames) if stream.frames else max_frames
+
+            buffer, count = None, 0
+            for frame in container.decode(stream):
+                if count >= max_frames:
+                    break
+                rgb = frame.to_ndarray(format="rgb24")
+                buffer = self._ensure_capacity(buffer, count, rgb.shape, capacity)
+                buffer[count] = rgb
+                count += 1
+        finally:
+            container.close()
+
+        return buffer[:count] if buffer is not None else np.empty((0,), dtype=np.uint8)
+
+    def _decode_cv2(self, path: str, max_frames: int) -> np.ndarray:
         import cv2
         cap = cv2.VideoCapture(path)
-        frames = []
-        count = 0
+        total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        capacity = min(max_frames, total) if total > 0 else max_frames
+
+        buffer, count = None, 0
         while cap.isOpened() and count < max_frames:
             ret, frame = cap.read()
             if not ret:
                 break
-            # Convert BGR to RGB
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frames.append(frame)
+            buffer = self._ensure_capacity(buffer, count, frame.shape, capacity)
+            # Convert BGR to RGB directly into the output slot
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buffer[count])
             count += 1
         cap.release()
-        return np.array(frames)
 
-    def _detect_faces(self, frames: np.ndarray) -> List[np.ndarray]:
-        from veridex.video.processing import FaceDetector
-        detector = FaceDetector()
+        return buffer[:count] if buffer is not None else np.empty((0,), dtype=np.uint8)
+
+    def _detect_faces(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Track the face through the frames.
+
+        Returns (T, 128, 128, 3) ROI crops when a trained PhysNet will consume
+        them, otherwise just the (T, 3) mean ROI colour that CHROM needs.
+        """
+        detector = self._get_detector()
+        _, weights_loaded = self._load_model()
 
         # Use the built-in tracking method for temporal consistency
         # Convert np.ndarray frames (T, H, W, C) to list for the detector
+        # The rPPG ROI is stable on talking-head video: detect every 10th frame,
+        # or sooner when the frame visibly changes
         frame_list = [f for f in frames]
-        roi_frames = detector.track_faces(frame_list, size=(128, 128))
-
-        return roi_frames # (T, 128, 128, 3)
+        roi_frames = detector.track_faces(
+            frame_list, size=(128, 128), detect_every=10, motion_threshold=3.0,
+            reduce_rgb=not weights_loaded,
+        )
+
+        return roi_frames # (T, 128, 128, 3) or (T, 3)
+
+    @staticmethod
+    def _is_flat(faces: np.ndarray) -> bool:
+        """True if the mean ROI colour never changes across frames."""
+        faces = np.asarray(faces)
+        trace = faces if faces.ndim == 2 else faces.reshape(len(faces), -1, faces.shape[-1]).mean(axis=1, dtype=np.float32)
+        return bool(np.all(np.ptp(trace, axis=0) < 1e-3))
+
+    def _extract_signal(self, face_frames: np.ndarray) -> tuple[np.ndarray, str]:
+        """Extract BV signal and return the method used ('physnet' or 'chrom')."""
+        model, weights_loaded = self._load_model()
+        if face_frames.ndim == 2:
+            # Already reduced to a (T, 3) RGB trace by _detect_faces
+            return chrom_bvp(face_frames, fs=30.0), "chrom"
+        if not weights_loaded:
+            # One contiguous reduce straight from uint8; CHROM normalizes each
+            # channel by its mean, so the 1/255 scale is not needed
+            rgb_trace = np.asarray(face_frames).reshape(len(face_frames), -1, 3).mean(axis=1, dtype=np.float32)
+            return chrom_bvp(rgb_trace, fs=30.0), "chrom"
 
-    def _extract_signal(self, face_frames: np.ndarray) -> tuple[np.ndarray, bool]:
-        """Extract BV signal and return whether trained weights were loaded."""
         import torch
-        from veridex.video.models.physnet import PhysNet
+        from veridex.video.models.compilation import inference_dtype
 
-        # Prepare for model
-        tensor = torch.from_numpy(face_frames).float() / 255.0
+        # Process in chunks if T is too large, but PhysNet is T-conv.
+        # T=300 might be big for memory.
+        # Let's use a sliding window or just crop to T=128 (approx 4 sec at 30fps)
+        # Crop before converting so only the frames used are promoted to float
+        face_frames = face_frames[:128]
+
+        # Prepare for model: one float copy, scaled in place
+        tensor = torch.from_numpy(np.ascontiguousarray(face_frames)).to(inference_dtype(self.allow_bf16)).mul_(1.0 / 255.0)
         tensor = tensor.permute(3, 0, 1, 2) # (C, T, H, W)
         tensor = tensor.unsqueeze(0) # (1, C, T, H, W)
 
+        with torch.no_grad():
+             signal = model(tensor) # (1, T)
+
+        return signal.squeeze().float().numpy(), "physnet"
+
+    def _get_detector(self):
+        """Return the face detector, creating it on first use."""
+        with self._lock:
+            if self._detector is None:
+                from veridex.video.processing import FaceDetector
+                self._detector = FaceDetector()
+            return self._detector
+
+    def _load_model(self):
+        """Build PhysNet and load its weights once; returns (model, weights_loaded)."""
+        with self._lock:
+            if self._model is None:
+                self._model, self._weights_loaded = self._build_model()
+            return self._model, self._weights_loaded
+
+    def _build_model(self):
+        import torch
+        from veridex.video.models.physnet import PhysNet
+        from veridex.video.models.compilation import compile_for_inference, inference_dtype
+        from veridex.video.models.fusion import fuse_conv_bn
+        from veridex.video.weights import get_weight_config
+
         model = PhysNet()
         model.eval()
 
         # Load weights from centralized config
-        from veridex.video.weights import get_weight_config
-        
         weight_config = get_weight_config('physnet')
         weights_url = weight_config['url']
         weights_path = os.path.join(get_cache_dir(), weight_config['filename'])
@@ -155,7 +359,9 @@ class RPPGSignal(BaseSignal):
 
         if os.path.exists(weights_path):
              try:
-                model.load_state_dict(torch.load(weights_path, map_location='cpu'))
+                # weights_only: plain state dicts load as before; pickled full-model
+                # checkpoints are refused instead of unpickled (arbitrary code)
+                model.load_state_dict(torch.load(weights_path, map_location='cpu', weights_only=True))
                 logger.info(f"✓ Loaded PhysNet weights from {weights_path}")
                 weights_loaded = True
              except Exception:
@@ -163,49 +369,53 @@ class RPPGSignal(BaseSignal):
         
         if not weights_loaded:
             warnings.warn(
-                "⚠ RPPGSignal is using untrained weights. Predictions are random.\n"
+                "⚠ RPPGSignal could not load PhysNet weights; falling back to the CHROM algorithm.\n"
                 "For production use, download real PhysNet weights.",
                 UserWarning,
                 stacklevel=2
             )
+            # The untrained model is never run, so skip fusing and compiling it
+            return model, weights_loaded
+
+        # Fold BatchNorm into the preceding convs now that weights are final
+        fuse_conv_bn(model)
+        # Cast after fusing so the folded BN constants are in the same dtype
+        dtype = inference_dtype(self.allow_bf16)
+        model.to(dtype)
+        if self.compile_model:
+            # Clips have 30-128 frames of 128x128 face ROIs; a dynamic graph
+            # covers every length instead of recompiling per T
+            model = compile_for_inference(
+                model, torch.zeros(1, 3, 128, 128, 128, dtype=dtype), dynamic=True
+            )
 
-        with torch.no_grad():
-             # Process in chunks if T is too large, but PhysNet is T-conv.
-             # T=300 might be big for memory.
-             # Let's use a sliding window or just crop to T=128 (approx 4 sec at 30fps)
-             T = tensor.shape[2]
-             if T > 128:
-                 tensor = tensor[:, :, :128, :, :]
-
-             signal = model(tensor) # (1, T)
-
-        return signal.squeeze().numpy(), weights_loaded
+        return model, weights_loaded
 
     def _analyze_psd(self, signal: np.ndarray) -> Tuple[float, Dict[str, Any]]:
-        from scipy import signal as scipy_signal
-
-        # Detrend
-        signal = scipy_signal.detrend(signal)
-
-        # PSD
+        # Detrend + PSD
         fs = 30.0 # Assumed FPS
-        freqs, psd = scipy_signal.periodogram(signal, fs)
+        freqs, psd = detrended_psd(signal, fs)
 
         # ROI: 0.7 Hz (42 BPM) to 4.0 Hz (240 BPM)
         mask = (freqs >= 0.7) & (freqs <= 4.0)
-        roi_power = np.trapz(psd[mask], freqs[mask])
-        total_power = np.trapz(psd, freqs)
+        roi_psd = psd[mask]
+        # Trapezoidal integrals on the evenly spaced bins, equal to np.trapz,
+        # so the 1e-6 guard keeps the weight the thresholds were tuned with
+        df = freqs[1] - freqs[0] if len(freqs) > 1 else 0.0
+        roi_power = _trapz_uniform(roi_psd, df)
+        total_power = _trapz_uniform(psd, df)
 
         snr = roi_power / (total_power + 1e-6)
 
         # Peak analysis
         # If real, there should be a dominant peak in ROI.
-        roi_psd = psd[mask]
         if len(roi_psd) > 0:
-            peak_power = np.max(roi_psd)
-            peak_ratio = peak_power / (np.mean(roi_psd) + 1e-6)
+            peak_idx = int(np.argmax(roi_psd))
+            peak_ratio = roi_psd[peak_idx] / (roi_psd.mean() + 1e-6)
+            dominant_freq = freqs[mask][peak_idx]
         else:
             peak_ratio = 0.0
+            dominant_freq = 0.0
 
         # Scoring:
         # High SNR + High Peak Ratio -> Human (Score 0)
@@ -228,7 +438,7 @@ class RPPGSignal(BaseSignal):
         metadata = {
             "snr": float(snr),
             "peak_ratio": float(peak_ratio),
-            "dominant_freq": float(freqs[mask][np.argmax(roi_psd)]) if len(roi_psd) > 0 else 0.0
+            "dominant_freq": float(dominant_freq)
         }
 
         return float(score), metadata
@@ -19,6 +19,11 @@ DEFAULT_WEIGHTS = {
         "url": "http://www.robots.ox.ac.uk/~vgg/software/lipsync/data/syncnet_v2.model",
         "filename": "syncnet_v2.pth",
         "sha256": None,
+    },
+    "yunet": {
+        "url": "https://github.com/opencv/opencv_zoo/raw/main/models/face_detection_yunet/face_detection_yunet_2023mar.onnx",
+        "filename": "face_detection_yunet_2023mar.onnx",
+        "sha256": None,
     }
 }
 
@@ -31,7 +36,7 @@ def get_weight_config(model_name: str) -> dict:
     Checks environment variables first, then falls back to defaults.
     
     Args:
-        model_name: One of 'physnet', 'i3d', 'syncnet'
+        model_name: One of 'physnet', 'i3d', 'syncnet', 'yunet'
         
     Returns:
         Dict with 'url', 'filename', 'sha256'
@@ -57,7 +62,7 @@ def set_weight_url(model_name: str, url: str, sha256: Optional[str] = None):
     Programmatically override weight URL.
     
     Args:
-        model_name: One of 'physnet', 'i3d', 'syncnet'
+        model_name: One of 'physnet', 'i3d', 'syncnet', 'yunet'
         url: New URL to use
         sha256: Optional SHA256 checksum
         